@@ -2,6 +2,7 @@
 Teletrax Presentation Generator - Main Streamlit App
 """
 
+import os
 import streamlit as st
 import pandas as pd
 from io import BytesIO
@@ -16,17 +17,17 @@ from utils import (
     create_slug_visualization,
     create_single_channel_ppt,
     create_multi_channel_ppt,
-    calculate_total_edits,  
-    calculate_lives_on_air,  
-    calculate_total_lives,  
-    calculate_total_countries,  
-    calculate_total_detection_length,
-    parse_timespan_to_seconds,
-    find_column,
+    compute_bottom_left_stats,
+    prepare_bottom_left_data,
+    calculate_channel_airtime,
     get_earliest_date,
     generate_channel_airtime_pie
 )
 
+# Pie charts are rendered at 180 dpi for the PowerPoint; on-screen previews
+# get their own cheaper, smaller render
+PREVIEW_DPI = 96
+
 # Page configuration
 st.set_page_config(
     page_title="Teletrax Automation Tool",
@@ -101,6 +102,18 @@ with st.sidebar:
         help="Total detection length across last 365 days. Format: HH:MM:SS",  
         key="manual_detection_length"  
     )
+
+    debug_mode = st.checkbox(
+        "Show debug analysis",
+        value=False,
+        help="Show the detailed Bottom Left file analysis when generating (slower on large files)"
+    )
+
+    compact_images = st.checkbox(
+        "Smaller PowerPoint file",
+        value=False,
+        help="Compress the chart images to a 256-colour palette (about a third of the size, slightly lossy)"
+    )
       
     st.markdown("---")  
     st.subheader("📝 Custom Text")
@@ -211,80 +224,86 @@ if st.button("🚀 Generate Presentation", type="primary", use_container_width=T
                # Calculate bottom left stats if file provided  
                 if bottom_left_file:  
                     st.info("📊 Calculating bottom left stats from uploaded data...")  
-                    df_bottom_left = load_data_file(bottom_left_file)
-                    
-                    # Show column names for debugging  
-                    with st.expander("🔍 Debug: Detailed Analysis"):  
-                        st.write("**Columns in uploaded file:**")  
-                        for i, col in enumerate(df_bottom_left.columns):  
-                            st.write(f"{i}: '{col}'")  
-                        st.write(f"**Total rows:** {len(df_bottom_left)}")
+                    # Resolve columns and parse Service/asset age once; shared by the
+                    # debug analysis, stats, airtime preview and PPT
+                    df_bottom_left, bl_cols = prepare_bottom_left_data(load_data_file(bottom_left_file))
+                    asset_age_col = bl_cols['age']
+
+                    if debug_mode:
+                        # Show column names for debugging  
+                        with st.expander("🔍 Debug: Detailed Analysis"):  
+                            st.write("**Columns in uploaded file:**")  
+                            st.dataframe(pd.DataFrame({'column': df_bottom_left.columns}), use_container_width=True)
+                            st.write(f"**Total rows:** {len(df_bottom_left)}")
                         
-                        # Analyze LIVE data specifically  
-                        if 'Service' in df_bottom_left.columns:  
-                            st.write("---")  
-                            st.subheader("LIVE Broadcast Analysis")
+                            # Analyze LIVE data specifically  
+                            if bl_cols['service']:  
+                                st.write("---")  
+                                st.subheader("LIVE Broadcast Analysis")
                             
-                            live_df = df_bottom_left[df_bottom_left['Service'].str.upper() == 'LIVE'].copy()  
-                            st.write(f"**Total LIVE hits:** {len(live_df)}")
+                                live_df = df_bottom_left[df_bottom_left['_is_live']].copy()  
+                                st.write(f"**Total LIVE hits:** {len(live_df)}")
                             
-                            # Check Asset age column  
-                            asset_age_col = find_column(df_bottom_left, ['Asset age (time span)', 'Asset age (timespan)', 'Asset age'])  
-                            if asset_age_col:  
-                                st.write(f"**Asset age column found:** '{asset_age_col}'")
+                                # Check Asset age column  
+                                if asset_age_col:  
+                                    st.write(f"**Asset age column found:** '{asset_age_col}'")
                                 
-                                # Show sample asset age values  
-                                st.write("**Sample asset age values from LIVE broadcasts:**")  
-                                sample_ages = live_df[asset_age_col].head(20).tolist()  
-                                for i, age in enumerate(sample_ages):  
-                                    parsed = parse_timespan_to_seconds(age)  
-                                    st.write(f"{i+1}. Raw: '{age}' → Parsed: {parsed} seconds ({parsed < 180})")
+                                    # Show sample asset age values  
+                                    st.write("**Sample asset age values from LIVE broadcasts:**")  
+                                    sample_ages = live_df[asset_age_col].head(20).tolist()  
+                                    parsed_ages = live_df['_age_sec'].head(20).tolist()
+                                    st.dataframe(pd.DataFrame({
+                                        'raw': [str(age) for age in sample_ages],
+                                        'parsed_seconds': parsed_ages,
+                                        'under_180': [parsed < 180 for parsed in parsed_ages]
+                                    }, index=range(1, len(sample_ages) + 1)), use_container_width=True)
                                 
-                                # Parse all asset ages  
-                                live_df['age_seconds'] = live_df[asset_age_col].apply(parse_timespan_to_seconds)
+                                    # Reuse the asset ages parsed for the stats  
+                                    live_df['age_seconds'] = live_df['_age_sec']
                                 
-                                valid_ages = live_df[live_df['age_seconds'] > 0]  
-                                st.write(f"**Valid age values:** {len(valid_ages)} out of {len(live_df)}")
+                                    valid_ages = live_df[live_df['age_seconds'] > 0]  
+                                    st.write(f"**Valid age values:** {len(valid_ages)} out of {len(live_df)}")
                                 
-                                if len(valid_ages) > 0:  
-                                    st.write(f"- Min: {valid_ages['age_seconds'].min()} sec")  
-                                    st.write(f"- Max: {valid_ages['age_seconds'].max()} sec")  
-                                    st.write(f"- Mean: {valid_ages['age_seconds'].mean():.1f} sec")
+                                    if len(valid_ages) > 0:  
+                                        st.write(f"- Min: {valid_ages['age_seconds'].min()} sec")  
+                                        st.write(f"- Max: {valid_ages['age_seconds'].max()} sec")  
+                                        st.write(f"- Mean: {valid_ages['age_seconds'].mean():.1f} sec")
                                     
-                                    under_180 = valid_ages[valid_ages['age_seconds'] < 180]  
-                                    st.write(f"**Rows with age < 180 sec:** {len(under_180)}")
+                                        under_180 = valid_ages[valid_ages['age_seconds'] < 180]  
+                                        st.write(f"**Rows with age < 180 sec:** {len(under_180)}")
                                     
-                                    # Check headline column  
-                                    headline_col = find_column(df_bottom_left, ['Headline', 'Asset: Headline', 'Asset headline'])  
-                                    if headline_col:  
-                                        st.write(f"**Headline column found:** '{headline_col}'")
+                                        # Check headline column  
+                                        headline_col = bl_cols['headline']
+                                        if headline_col:  
+                                            st.write(f"**Headline column found:** '{headline_col}'")
                                         
-                                        # Count unique headlines under 180 sec  
-                                        unique_headlines_under_180 = under_180[headline_col].dropna().nunique()  
-                                        st.write(f"**Unique headlines with age < 180 sec:** {unique_headlines_under_180}")
+                                            # Count unique headlines under 180 sec  
+                                            unique_headlines_under_180 = under_180[headline_col].dropna().nunique()  
+                                            st.write(f"**Unique headlines with age < 180 sec:** {unique_headlines_under_180}")
                                         
-                                        # Show sample  
-                                        st.write("**Sample headlines under 180 sec:**")  
-                                        st.dataframe(under_180[[headline_col, asset_age_col, 'age_seconds']].head(10))  
+                                            # Show sample  
+                                            st.write("**Sample headlines under 180 sec:**")  
+                                            st.dataframe(under_180[[headline_col, asset_age_col, 'age_seconds']].head(10))  
+                                        else:  
+                                            st.error("❌ Headline column not found!")  
                                     else:  
-                                        st.error("❌ Headline column not found!")  
+                                        st.error("⚠️ No valid asset age values parsed!")  
                                 else:  
-                                    st.error("⚠️ No valid asset age values parsed!")  
-                            else:  
-                                st.error("❌ Asset age column not found!")
+                                    st.error("❌ Asset age column not found!")
                             
-                            # Check total unique headlines for all LIVE  
-                            headline_col = find_column(df_bottom_left, ['Headline', 'Asset: Headline', 'Asset headline'])  
-                            if headline_col:  
-                                total_unique_headlines = live_df[headline_col].dropna().nunique()  
-                                st.write(f"**Total unique LIVE headlines (no age filter):** {total_unique_headlines}")
+                                # Check total unique headlines for all LIVE  
+                                headline_col = bl_cols['headline']
+                                if headline_col:  
+                                    total_unique_headlines = live_df[headline_col].dropna().nunique()  
+                                    st.write(f"**Total unique LIVE headlines (no age filter):** {total_unique_headlines}")
                     
-                    # Calculate stats  
-                    total_edits = calculate_total_edits(df_bottom_left, use_unique_assets=True)  
-                    lives_on_air = calculate_lives_on_air(df_bottom_left, max_duration_seconds=180, use_unique_assets=True)  
-                    total_lives = calculate_total_lives(df_bottom_left, use_unique_assets=True)  
-                    total_countries = calculate_total_countries(df_bottom_left)  
-                    total_detection_length = calculate_total_detection_length(df_bottom_left)
+                    # Calculate stats (single pass over the file)
+                    stats = compute_bottom_left_stats(df_bottom_left, max_duration_seconds=180, cols=bl_cols)
+                    total_edits = stats['total_edits']
+                    lives_on_air = stats['lives_on_air']
+                    total_lives = stats['total_lives']
+                    total_countries = stats['total_countries']
+                    total_detection_length = stats['total_detection_length']
                     
                     st.success(f"✅ **Calculated Stats:**")
   
@@ -334,32 +353,22 @@ if st.button("🚀 Generate Presentation", type="primary", use_container_width=T
                     total_detection_length=total_detection_length  
                 )
                   
-                # Generate country pie chart (only if we have data)  
+                # Generate country pie chart (only if we have data): full resolution
+                # for the PowerPoint, screen resolution for the preview
                 if df_country is not None and not df_country.empty and len(df_country.columns) > 0:  
-                    country_chart_img = generate_3d_beveled_pie_chart(  
-                        df_country,  
+                    country_pie_args = dict(  
                         channel_name=channel_names[0] if channel_names else "",  
                         title="Use by country",  
                         subtitle=date_range  
-                    )  
+                    )
+                    country_chart_png = generate_3d_beveled_pie_chart(df_country, **country_pie_args)
+                    country_preview_png = generate_3d_beveled_pie_chart(df_country, **country_pie_args, dpi=PREVIEW_DPI)
                 else:  
-                    # Create empty BytesIO if no country data  
-                    country_chart_img = BytesIO()  
+                    # Empty image if no country data  
+                    country_chart_png = country_preview_png = b""  
                     if presentation_type == "Single Channel":  
                         st.warning("⚠️ No country distribution data available")  
 
-                # Generate main charts
-                fig_time = generate_time_series_chart(
-                    df_time,
-                    channel_name=channel_names[0] if channel_names else "",
-                    title="Use by Month"
-                )
-                fig_country = generate_3d_beveled_pie_chart(
-                    df_country,
-                    channel_name=channel_names[0] if channel_names else "",
-                    title="Use by Country",
-                    subtitle=date_range
-                )
                 # Display previews
                 st.markdown("---")
                 st.header("📊 Chart Previews")
@@ -376,25 +385,27 @@ if st.button("🚀 Generate Presentation", type="primary", use_container_width=T
                         # Show channel airtime chart  
                         if bottom_left_file:  
                             try:  
-                                channel_airtime_preview = generate_channel_airtime_pie(  
+                                channel_airtime_png = generate_channel_airtime_pie(  
                                     df_bottom_left,  
                                     title="Time on air by channel",  
-                                    subtitle="Material under 30 days"  
-                                )  
-                                channel_airtime_preview.seek(0)  
-                                st.image(channel_airtime_preview, use_container_width=True)  
-                            except:  
+                                    subtitle="Material under 30 days",  
+                                    cols=bl_cols,  
+                                    dpi=PREVIEW_DPI  
+                                )
+                            except Exception:
+                                channel_airtime_png = b""
+                            # Empty bytes means there was no airtime to chart
+                            if channel_airtime_png:
+                                st.image(channel_airtime_png, use_container_width=True)  
+                            else:  
                                 st.markdown("**Top Right: Country Distribution**")  
-                                country_chart_img.seek(0)  
-                                st.image(country_chart_img, use_container_width=True)  
+                                st.image(country_preview_png, use_container_width=True)  
                         else:  
                             st.markdown("**Top Right: Country Distribution**")  
-                            country_chart_img.seek(0)  
-                            st.image(country_chart_img, use_container_width=True)  
+                            st.image(country_preview_png, use_container_width=True)  
                     else:  
                         st.markdown("**Top Right: Country Distribution**")  
-                        country_chart_img.seek(0)  
-                        st.image(country_chart_img, use_container_width=True)  
+                        st.image(country_preview_png, use_container_width=True)  
 
                 preview_col3, preview_col4 = st.columns(2)
                 
@@ -432,42 +443,35 @@ if st.button("🚀 Generate Presentation", type="primary", use_container_width=T
                     for ch_name, ch_file in channel_files.items():
                         channel_data[ch_name] = load_data_file(ch_file)
                     
-                    # Generate charts (now returns BytesIO images)
-                    channel_charts = generate_multi_channel_charts(channel_data)
+                    # Generate charts (cached PNG bytes, wrapped for the pptx)
+                    channel_charts = {
+                        ch_name: BytesIO(png_bytes)
+                        for ch_name, png_bytes in generate_multi_channel_charts(channel_data).items()
+                    }
+                    # Grid thumbnails skip the decorative overlays; the pptx keeps them
+                    channel_previews = generate_multi_channel_charts(
+                        channel_data, dpi=PREVIEW_DPI, style="minimal"
+                    )
                     
                     # Display in grid
-                    num_cols = min(3, len(channel_charts))
+                    num_cols = min(3, len(channel_previews))
                     cols = st.columns(num_cols)
                     
-                    for idx, (ch_name, img_buffer) in enumerate(channel_charts.items()):
+                    for idx, (ch_name, preview_png) in enumerate(channel_previews.items()):
                         with cols[idx % num_cols]:
-                            img_buffer.seek(0)
-                            st.image(img_buffer, caption=ch_name, use_container_width=True)
-                
+                            st.image(preview_png, caption=ch_name, use_container_width=True)
                 
-                # Generate PowerPoint  
-                config = {  
-                    'channel_name': channel_names[0] if len(channel_names) == 1 else ', '.join(channel_names),  
-                    'channel_names': channel_names,  
-                    'date_range': date_range  
-                }
-                
-                if presentation_type == "Single Channel":  
-                    ppt_stream = create_single_channel_ppt(  
-                        config, fig_time, country_chart_img, stats_text, slug_viz  
-                    )  
 
                 # Debug channel airtime  
                 if bottom_left_file and presentation_type == "Multi-Channel":  
                     st.write("🔍 Debug - Channel Airtime Data:")  
-                    from utils.data_processing import calculate_channel_airtime  
-                    df_airtime = calculate_channel_airtime(df_bottom_left, max_age_days=30)  
+                    df_airtime = calculate_channel_airtime(df_bottom_left, max_age_days=30, cols=bl_cols)
                     st.dataframe(df_airtime)
                     
                     # Show raw channel names  
-                    if 'Channel: Name' in df_bottom_left.columns:  
+                    if bl_cols['channel']:  
                         st.write("Unique channels in data:")  
-                        st.write(df_bottom_left['Channel: Name'].unique())  
+                        st.write(df_bottom_left[bl_cols['channel']].unique())  
 
                 # Generate PowerPoint
                 st.markdown("---")
@@ -477,28 +481,36 @@ if st.button("🚀 Generate Presentation", type="primary", use_container_width=T
                     config = {
                         'channel_name': channel_names[0] if len(channel_names) == 1 else ', '.join(channel_names),
                         'channel_names': channel_names,
-                        'date_range': date_range
+                        'date_range': date_range,
+                        'compact_images': compact_images
                     }
                     
                     if presentation_type == "Single Channel":
-                        ppt_stream = create_single_channel_ppt(
-                            config, fig_time, country_chart_img, stats_text, slug_viz  # Changed
+                        ppt_path = create_single_channel_ppt(
+                            config, fig_time, BytesIO(country_chart_png), stats_text, slug_viz  # Changed
                         )
                     else:
-                        ppt_stream = create_multi_channel_ppt(
-                            config, fig_time, country_chart_img, stats_text, slug_viz, channel_charts, df_bottom_left if bottom_left_file else None 
+                        ppt_path = create_multi_channel_ppt(
+                            config, fig_time, BytesIO(country_chart_png), stats_text, slug_viz, channel_charts,
+                            df_bottom_left if bottom_left_file else None,
+                            bottom_left_cols=bl_cols if bottom_left_file else None
                         )
                     
                     # Download button
                     filename = f"{'_'.join(channel_names)}_teletrax_report.pptx".replace(' ', '_')
                     
-                    st.download_button(
-                        label="⬇️ Download PowerPoint Presentation",
-                        data=ppt_stream,
-                        file_name=filename,
-                        mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                        use_container_width=True
-                    )
+                    # Stream the deck from disk, then drop the temp file
+                    try:
+                        with open(ppt_path, 'rb') as ppt_file:
+                            st.download_button(
+                                label="⬇️ Download PowerPoint Presentation",
+                                data=ppt_file,
+                                file_name=filename,
+                                mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                                use_container_width=True
+                            )
+                    finally:
+                        os.remove(ppt_path)
                     
                     st.success("✅ Presentation generated successfully!")
                 
@@ -6,7 +6,7 @@ Color palette configuration extracted from Teletrax presentation images
 LINE_CHART_COLOR = '#D97847'
 
 # Pie chart colors (in order of usage)
-PIE_COLORS = [
+PIE_COLORS = (
     '#2B5B7E',  # Navy/Dark Blue
     '#6B9FBF',  # Light Blue
     '#D97847',  # Orange
@@ -21,7 +21,12 @@ PIE_COLORS = [
     '#8B5A2B',  # Medium Brown
     '#4A7BA7',  # Steel Blue
     '#6B8E23',  # Olive
-]
+)
+
+# PIE_COLORS as (r, g, b) floats in 0-1, converted once for matplotlib
+PIE_COLORS_RGB = tuple(
+    tuple(int(h[i:i + 2], 16) / 255 for i in (1, 3, 5)) for h in PIE_COLORS
+)
 
 # Chart styling
 CHART_FONT = "Arial"
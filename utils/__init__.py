@@ -14,7 +14,11 @@ from .data_processing import (
     calculate_total_lives,  
     calculate_total_edits,  
     calculate_total_countries,
+    compute_bottom_left_stats,
+    prepare_bottom_left_data,
+    live_service_mask,
     parse_timespan_to_seconds,
+    parse_timespan_series,
     find_column,
     get_earliest_date,
     calculate_channel_airtime
@@ -25,7 +29,8 @@ from .chart_generator import (
     generate_3d_beveled_pie_chart,  
     generate_multi_channel_charts,  
     create_slug_visualization,
-    generate_channel_airtime_pie
+    generate_channel_airtime_pie,
+    figure_to_png
 )
   
 from .ppt_generator import (  
@@ -51,8 +56,13 @@ __all__ = [
     'calculate_total_lives',  
     'calculate_total_edits',  
     'calculate_total_countries',
+    'compute_bottom_left_stats',
+    'prepare_bottom_left_data',
+    'live_service_mask',
     'parse_timespan_to_seconds',
+    'parse_timespan_series',
     'find_column',
      'calculate_channel_airtime',   
-    'generate_channel_airtime_pie'
+    'generate_channel_airtime_pie',
+    'figure_to_png'
 ]  
\ No newline at end of file
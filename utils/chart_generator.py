@@ -3,23 +3,33 @@ Chart generation utilities using Matplotlib
 """
 
 import plotly.graph_objects as go
-import matplotlib.pyplot as plt
-from matplotlib import patches
-from mpl_toolkits.mplot3d import Axes3D
+import streamlit as st
+from matplotlib.patches import Wedge, Polygon
+from matplotlib.transforms import Affine2D
+from matplotlib.figure import Figure
+from matplotlib.collections import PatchCollection, LineCollection
+from matplotlib.font_manager import FontProperties
 import pandas as pd
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Literal
 from io import BytesIO
+from threading import Lock
 from config.colours import (
     LINE_CHART_COLOR, 
-    PIE_COLORS, 
+    PIE_COLORS_RGB,
     CHART_FONT, 
     CHART_BG_COLOR, 
     GRID_COLOR
 )
+from utils.data_processing import (
+    DATAFRAME_HASH_FUNCS,
+    prepare_country_data,
+    calculate_channel_airtime
+)
 
 # GENERATE CHARTS
 
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def generate_time_series_chart(df: pd.DataFrame,   
                                channel_name: str = "",  
                                title: str = "Use by Month",  
@@ -38,47 +48,44 @@ def generate_time_series_chart(df: pd.DataFrame,
     Returns:  
         Plotly Figure object  
     """  
-    fig = go.Figure()
-      
-    # Parse dates  
+    # Parse dates (Excel uploads usually arrive already as datetimes)  
     try:  
-        dates = pd.to_datetime(df.iloc[:, 0])  
+        dates = df.iloc[:, 0]  
+        if not pd.api.types.is_datetime64_any_dtype(dates):  
+            dates = pd.to_datetime(dates)  
         formatted_dates = dates.dt.strftime('%b %Y')  
     except:  
         formatted_dates = df.iloc[:, 0]  
         dates = pd.to_datetime(formatted_dates, format='%b %Y', errors='coerce')
       
-    # Add line trace  
-    fig.add_trace(go.Scatter(  
+    # Line trace  
+    trace = go.Scatter(  
         x=formatted_dates,  
         y=df.iloc[:, 1],  
         mode='lines',  
         line=dict(color=LINE_CHART_COLOR, width=3.5),  
         name='Assets',  
         hovertemplate='%{x}<br>Assets: %{y:,}<extra></extra>'  
-    ))
+    )
       
     # Create custom tick values - only Jan, May, Sep of each year  
     if dates is not None and not dates.isna().all():  
-        # Get unique years  
-        years = dates.dt.year.unique()
+        # First row of each Jan, May, Sep in the data, in calendar order  
+        months = pd.DataFrame({'year': dates.dt.year, 'month': dates.dt.month})
+        months = months[months['month'].isin([1, 5, 9])]
+        months['pos'] = np.flatnonzero(dates.dt.month.isin([1, 5, 9]))
+        months = months.drop_duplicates(['year', 'month']).sort_values(['year', 'month'])
         
         # Create tick positions for Jan, May, Sep of each year  
-        tick_vals = []  
-        tick_text = []
-        
-        for year in sorted(years):  
-            for month in [1, 5, 9]:  # January, May, September  
-                # Find if this month exists in the data  
-                mask = (dates.dt.year == year) & (dates.dt.month == month)  
-                if mask.any():  
-                    # Get the index of this month  
-                    idx = mask.idxmax()  
-                    tick_vals.append(formatted_dates.iloc[idx])  
-                    tick_text.append(f"{['Jan', 'May', 'Sep'][(month-1)//4]} {year}")
+        tick_vals = formatted_dates.iloc[months['pos']].tolist()
+        tick_text = [
+            f"{['Jan', 'May', 'Sep'][(month - 1) // 4]} {year}"
+            for year, month in zip(months['year'].astype(int), months['month'].astype(int))
+        ]
         
         # Set custom ticks (no vertical grid lines)  
         xaxis_config = dict(  
+            title=dict(text=''),  
             tickmode='array',  
             tickvals=tick_vals,  
             ticktext=tick_text,  
@@ -89,6 +96,7 @@ def generate_time_series_chart(df: pd.DataFrame,
     else:  
         # Fallback if date parsing fails  
         xaxis_config = dict(  
+            title=dict(text=''),  
             showgrid=False,    
             tickangle=-45,  
             tickfont=dict(size=9)  
@@ -99,16 +107,15 @@ def generate_time_series_chart(df: pd.DataFrame,
     if total_detection_length and total_detection_length != "00:00:00":  
         full_title += f"<br><sub>Total Detection Length (last 365 days): {total_detection_length}</sub>"
     
-    # Update layout  
-    fig.update_layout(  
+    # Layout (built once with the figure; the fixed settings below don't
+    # need Plotly's per-property validation on every render)
+    layout = dict(  
         title=dict(  
             text=full_title,  
             font=dict(size=20, family=CHART_FONT, color='#333', weight='bold'),  
             x=0.5,  
             xanchor='center'  
         ),  
-        xaxis_title="",  
-        yaxis_title="",  
         plot_bgcolor='white',  
         paper_bgcolor='white',  
         height=height,  
@@ -117,6 +124,7 @@ def generate_time_series_chart(df: pd.DataFrame,
         showlegend=False,  
         xaxis=xaxis_config,  # Use the config directly (already has showgrid=False)  
         yaxis=dict(  
+            title=dict(text=''),  
             showgrid=True,  # Keep horizontal gridlines  
             gridcolor='#E5E5E5',  
             tickformat=','  
@@ -124,8 +132,123 @@ def generate_time_series_chart(df: pd.DataFrame,
         hovermode='x unified'  
     )    
 
-    return fig  
+    return go.Figure(data=[trace], layout=layout, _validate=False)  
+
+# Kaleido 1.x (see requirements.txt) keeps one Chrome instance alive for the
+# whole process once its sync server is started; without it every to_image()
+# call launches and tears down its own browser
+_KALEIDO_LOCK = Lock()
+_kaleido_started = False
+
+
+def _ensure_kaleido_server() -> None:
+    """Start Kaleido's persistent sync server once, if the installed version has one"""
+    global _kaleido_started
+    if _kaleido_started:
+        return
+    with _KALEIDO_LOCK:
+        if _kaleido_started:
+            return
+        try:
+            import kaleido
+            start = getattr(kaleido, "start_sync_server", None)
+            if start is not None:
+                start(silence_warnings=True)
+        except Exception:
+            # Fall back to plotly's own per-call export
+            pass
+        _kaleido_started = True
+
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs={go.Figure: lambda fig: fig.to_json()},
+    max_entries=128,
+)
+def figure_to_png(fig: go.Figure, width: int = 800, height: int = 600,
+                  scale: float = 1.0) -> bytes:
+    """
+    Export a Plotly figure to PNG bytes for the PowerPoint
+
+    Keyed on the figure's JSON and the image size, so repeated clicks with the
+    same chart reuse the image instead of starting another Kaleido export.
+    Only the 128 most recently used images are kept in memory.
+
+    Args:
+        fig: Plotly figure (e.g. from generate_time_series_chart)
+        width: Image width in pixels
+        height: Image height in pixels
+        scale: Pixel multiplier; the chart is laid out at width x height and
+            rasterized at scale times that, so fonts keep their proportions
+
+    Returns:
+        PNG bytes
+    """
+    _ensure_kaleido_server()
+    return fig.to_image(format="png", width=width, height=height, scale=scale)
+
+# Bold chart font shared by every pie slice label; built once so the
+# per-label text calls don't each resolve family/weight again
+_PIE_FONT = FontProperties(family=CHART_FONT, weight="bold")
+
+
+def _slice_colors(n: int) -> np.ndarray:
+    """(n, 3) array of pie RGB colors, cycling the palette when n exceeds it"""
+    return np.asarray(PIE_COLORS_RGB)[np.arange(n) % len(PIE_COLORS_RGB)]
+
+def _ang_sweep(a1: float, a2: float, step: float = 2.0, cw: bool = True) -> np.ndarray:
+    """Angles (degrees) from a1 to a2 in fixed steps, always ending exactly on a2"""
+    if cw:
+        a2 = a1 - ((a1 - a2) % 360.0)
+        if a2 > a1: a2 -= 360.0
+        arr = np.arange(a1, a2 - 1e-6, -step)
+    else:
+        a2 = a1 + ((a2 - a1) % 360.0)
+        if a2 < a1: a2 += 360.0
+        arr = np.arange(a1, a2 + 1e-6, step)
+    if arr[-1] != a2: arr = np.append(arr, a2)
+    return arr
+
+def _slice_angles(values, total: float, start_angle: float, clockwise: bool = True):
+    """
+    Slice geometry for the whole pie in one vectorized pass
+
+    Returns:
+        Tuple of arrays (sweep in degrees, start angle t1, end angle t2,
+        mid angle in radians), one entry per slice
+    """
+    angs = np.asarray(values, dtype=float) / total * 360.0
+    swept = np.cumsum(angs)
+    t2s = start_angle - swept if clockwise else start_angle + swept
+    t1s = np.r_[start_angle, t2s[:-1]]
+    mids = np.deg2rad((t1s + t2s) / 2.0)
+    return angs, t1s, t2s, mids
+
+def _front_wall_points(t1: float, t2: float, radius: float, y_scale: float, wall_px: float,
+                       front_dir_deg: float, clockwise: bool = True):
+    """
+    Outline of a slice's side wall on the visible (front) half of the disk
+
+    The whole arc is computed in one pass of NumPy array operations.
 
+    Returns:
+        (N, 2) array of polygon points (top edge, then bottom edge reversed),
+        or None when fewer than two arc points face the front
+    """
+    arc = _ang_sweep(t1, t2, step=2.0, cw=clockwise)
+    d = np.deg2rad((np.mod(arc - front_dir_deg, 360.0) + 180) % 360 - 180)
+    arc = arc[np.abs(d) <= np.pi / 2]  # front half only
+    if len(arc) < 2:
+        return None
+
+    a_rad = np.deg2rad(arc)
+    x = radius * np.cos(a_rad)
+    y_top = radius * np.sin(a_rad) * y_scale
+    # constant wall height (no taper) -> flat disk feel
+    y_bot = y_top - wall_px
+    return np.column_stack([np.r_[x, x[::-1]], np.r_[y_top, y_bot[::-1]]])
+
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def generate_3d_beveled_pie_chart(
     df: pd.DataFrame,
     channel_name: str = "",
@@ -134,54 +257,47 @@ def generate_3d_beveled_pie_chart(
     target_percentage: float = 0.70,
     min_label_pct: float = 3.0,         
     inside_min_angle_deg: float = 18.0,  # >= angle -> label INSIDE
-) -> BytesIO:
+    dpi: int = 180,                      # 180 for the PowerPoint; lower for screen
+    style: Literal["decorated", "minimal"] = "decorated",  # "minimal" skips rim/bevel/band
+) -> bytes:
     """
     projected disk:
       - Flat top (ellipse projection), NO spherical highlight
       - Side wall only on the FRONT half, constant dark shade (disk feel)
-      - Thin outer rim + tiny center bevel (very subtle)
+      - Thin outer rim + tiny center bevel (very subtle; omitted with style="minimal")
       - Small slices at the FRONT, big slices at the BACK
       - Labels: big slices INSIDE, small slices OUTSIDE with elbow leader
       - Exact label text preserved: "{label}\\n{percent}%"
-    """
-    import numpy as np
-    import matplotlib.pyplot as plt
-    from matplotlib.patches import Wedge, Polygon
-    from matplotlib.transforms import Affine2D
-    from utils.data_processing import prepare_country_data
-    from config.colours import PIE_COLORS
-    from io import BytesIO
 
+    Returns PNG bytes (b"" when there is nothing to plot) so the cached
+    result is immutable; wrap in BytesIO at the call site.
+    """
     # Check if input is empty  
     if df is None or df.empty or len(df.columns) == 0:  
-        return BytesIO()
+        return b""
     
     # ---------- data ----------
     df_chart = prepare_country_data(df, target_percentage=target_percentage)
     if df_chart.empty or df_chart.shape[1] < 2:
-        return BytesIO()
+        return b""
 
-    # Check if preparation resulted in empty data  
-    if df_chart.empty or len(df_chart.columns) == 0:  
-        return BytesIO()
-    
     loc_col, hits_col = df_chart.columns[:2]
     labels = df_chart[loc_col].astype(str).tolist()
     values = df_chart[hits_col].astype(float).tolist()
     total = float(sum(values))
     if total <= 0:
-        return BytesIO()
+        return b""
 
     # Place SMALL slices at the FRONT (start at 270° and sweep clockwise)
+    # Per-slice data is kept as parallel arrays (labels, values, percents,
+    # colors, angles) rather than a list of tuples
     order = np.argsort(values)  # ascending: small -> large
     labels   = [labels[i] for i in order]
-    values   = [values[i] for i in order]
-    percents = [v / total * 100 for v in values]
+    values   = np.asarray(values)[order]
+    percents = values / total * 100
 
-    # Colors 
-    colors_hex = (PIE_COLORS * ((len(values)//len(PIE_COLORS))+1))[:len(values)]
-    def hx2rgb01(h): return tuple(int(h[1+i:3+i],16)/255 for i in (0,2,4))
-    colors_rgb = [hx2rgb01(h) for h in colors_hex]
+    # Colors (pre-converted palette, repeat if needed) as an (N, 3) array
+    colors_rgb = _slice_colors(len(values))
 
     # ---------- geometry / projection ----------
     R = 1.0
@@ -193,95 +309,60 @@ def generate_3d_beveled_pie_chart(
     front_dir_deg = -90.0   # front direction (downward)
 
     # ---------- figure ----------
-    fig, ax = plt.subplots(figsize=(10.0, 6.2), dpi=180)
+    # Standalone Figure (not registered with pyplot): no global figure
+    # manager to create/tear down, and safe across concurrent sessions
+    fig = Figure(figsize=(10.0, 6.2), dpi=dpi)
+    ax = fig.subplots()
     fig.patch.set_facecolor("white")
     ax.set_aspect("equal")
     ax.axis("off")
 
     to_ellipse = Affine2D().scale(1.0, y_scale) + ax.transData
 
-    def norm(a): 
-        a = a % 360.0
-        return a if a >= 0 else a + 360.0
-
-    def ang_sweep(a1, a2, step=2.0, cw=True):
-        if cw:
-            a2 = a1 - ((a1 - a2) % 360.0)
-            if a2 > a1: a2 -= 360.0
-            arr = np.arange(a1, a2 - 1e-6, -step)
-            if arr[-1] != a2: arr = np.append(arr, a2)
-        else:
-            a2 = a1 + ((a2 - a1) % 360.0)
-            if a2 < a1: a2 += 360.0
-            arr = np.arange(a1, a2 + 1e-6, step)
-            if arr[-1] != a2: arr = np.append(arr, a2)
-        return arr
-
-    # build slices
-    theta = start_angle
-    slices = []
-    for lab, val, pct, col in zip(labels, values, percents, colors_rgb):
-        ang = (val/total)*360.0
-        t1, t2 = theta, (theta - ang if clockwise else theta + ang)
-        slices.append((lab, pct, col, t1, t2))
-        theta = t2
+    # build slices (angles computed once, shared by every layer and the labels)
+    angs, t1s, t2s, mids = _slice_angles(values, total, start_angle, clockwise)
 
     # 1) draw all top wedges (FLAT colors — no radial/spherical shading)
-    for lab, pct, col, t1, t2 in slices:
-        w = Wedge(center, R, t2, t1, facecolor=col, edgecolor="#1a1a1a", linewidth=0.6)
-        w.set_transform(to_ellipse)
-        ax.add_patch(w)
+    #    one collection per layer instead of one artist per slice
+    tops = PatchCollection([Wedge(center, R, t2, t1) for t1, t2 in zip(t1s, t2s)],
+                           facecolors=colors_rgb,
+                           edgecolors="#1a1a1a", linewidths=0.6, transform=to_ellipse)
+    ax.add_collection(tops, autolim=False)
 
     # 2) draw front-only side wall (constant darker shade -> disk, not sphere)
-    for lab, pct, col, t1, t2 in slices:
-        arc = ang_sweep(t1, t2, step=2.0, cw=clockwise)
-        vis = []
-        for a in arc:
-            d = np.deg2rad((norm(a - front_dir_deg) + 180) % 360 - 180)
-            if abs(d) <= np.pi/2:  # front half only
-                vis.append((a, d))
-        if len(vis) < 2:
+    sides, walled = [], []
+    for i, (t1, t2) in enumerate(zip(t1s, t2s)):
+        poly_pts = _front_wall_points(t1, t2, R, y_scale, wall_px, front_dir_deg, clockwise)
+        if poly_pts is None:
             continue
 
-        top_edge = []
-        bot_edge = []
-        for a, d in vis:
-            x = R * np.cos(np.deg2rad(a))
-            y_top = R * np.sin(np.deg2rad(a)) * y_scale
-            # constant wall height (no taper) -> flat disk feel
-            y_bot = y_top - wall_px
-            top_edge.append((x, y_top))
-            bot_edge.append((x, y_bot))
-
-        poly_pts = top_edge + bot_edge[::-1]
-        side = Polygon(poly_pts, closed=True,
-                       facecolor=tuple(c * 0.55 for c in col),  # darker side
-                       edgecolor="none", linewidth=0)
-        ax.add_patch(side)
-
-    # 3) thin outer rim (top)
-    rim = Wedge(center, R*1.006, 0, 360, facecolor="none", edgecolor="#0d0d0d", linewidth=0.6)
-    rim.set_transform(to_ellipse)
-    ax.add_patch(rim)
-
-    # 4) tiny center bevel (VERY subtle so it doesn’t look spherical)
-    bevel = Wedge(center, R*0.14, 0, 360, facecolor="#000000", edgecolor="none", linewidth=0)
-    bevel.set_alpha(0.07)          # much lower alpha
-    bevel.set_transform(to_ellipse)
-    ax.add_patch(bevel)
-
-    # 5) faint back highlight band (linear look, not a dome)
-    back_band = Wedge(center, R*1.00, 110, 70, facecolor="#ffffff", edgecolor="none")
-    back_band.set_alpha(0.035)     # whisper-light
-    back_band.set_transform(to_ellipse)
-    ax.add_patch(back_band)
+        sides.append(Polygon(poly_pts, closed=True))
+        walled.append(i)
+    side_colors = colors_rgb[walled] * 0.55  # darker side
+    ax.add_collection(PatchCollection(sides, facecolors=side_colors, edgecolors="none", linewidths=0),
+                      autolim=False)
+
+    if style == "decorated":
+        # 3) thin outer rim (top)
+        rim = Wedge(center, R*1.006, 0, 360, facecolor="none", edgecolor="#0d0d0d", linewidth=0.6)
+        rim.set_transform(to_ellipse)
+        ax.add_patch(rim)
+
+        # 4) tiny center bevel (VERY subtle so it doesn’t look spherical)
+        bevel = Wedge(center, R*0.14, 0, 360, facecolor="#000000", edgecolor="none", linewidth=0)
+        bevel.set_alpha(0.07)          # much lower alpha
+        bevel.set_transform(to_ellipse)
+        ax.add_patch(bevel)
+
+        # 5) faint back highlight band (linear look, not a dome)
+        back_band = Wedge(center, R*1.00, 110, 70, facecolor="#ffffff", edgecolor="none")
+        back_band.set_alpha(0.035)     # whisper-light
+        back_band.set_transform(to_ellipse)
+        ax.add_patch(back_band)
 
     # ---------- labels ----------
-    theta = start_angle
-    for lab, val, pct, col in zip(labels, values, percents, colors_rgb):
-        ang = (val/total)*360.0
-        t1, t2 = theta, (theta - ang if clockwise else theta + ang)
-        mid = np.deg2rad((t1 + t2) / 2.0)
+    leaders = []
+    for lab, pct, col, ang, mid in zip(labels, percents, colors_rgb, angs, mids):
         ang_abs = abs(ang)
 
         # point on ellipse for leader start
@@ -292,7 +373,7 @@ def generate_3d_beveled_pie_chart(
             r_txt = 0.62 * R
             x, y = r_txt*np.cos(mid), r_txt*np.sin(mid)*y_scale
             ax.text(x, y, f"{lab}\n{pct:.0f}%", ha="center", va="center",
-                    fontsize=10, fontweight="bold", color="white", fontfamily="Arial", zorder=10)
+                    fontsize=10, fontproperties=_PIE_FONT, color="white", zorder=10)
         elif pct >= min_label_pct:
             # OUTSIDE elbow leader
             r1 = 1.06 * R
@@ -300,62 +381,79 @@ def generate_3d_beveled_pie_chart(
             to_right = (np.cos(mid) >= 0)
             x2 = x1 + (0.22 if to_right else -0.22)
             y2 = y1
-            ax.plot([rx, x1, x2], [ry, y1, y2], color="#444", linewidth=1.0, zorder=999)
+            leaders.append([(rx, ry), (x1, y1), (x2, y2)])
 
             ha = "left" if to_right else "right"
             ax.text(x2, y2, f"{lab}\n{pct:.0f}%", ha=ha, va="center",
-                    fontsize=9.5, fontweight="bold", color="white", fontfamily="Arial",
+                    fontsize=9.5, fontproperties=_PIE_FONT, color="white",
                     bbox=dict(boxstyle="round,pad=0.28", facecolor=col,
                               edgecolor="#1a1a1a", lw=0.7, alpha=0.96),
                     zorder=1000)
 
-        theta = t2
+    if leaders:
+        ax.add_collection(LineCollection(leaders, colors="#444", linewidths=1.0,
+                                         capstyle="projecting", joinstyle="round",
+                                         zorder=999), autolim=False)
 
     # bounds & title
     ax.set_xlim(-1.6, 1.6)
     ax.set_ylim(-1.25, 1.05)
 
     full_title = f"{channel_name} {subtitle}: {title}" if channel_name and subtitle else title
-    plt.title(full_title, fontsize=20, fontfamily="Arial", color="#555", pad=8, fontweight="bold")
+    ax.set_title(full_title, fontsize=20, fontfamily="Arial", color="#555", pad=8, fontweight="bold")
 
     # export
     buf = BytesIO()
-    plt.savefig(buf, format="png", dpi=180, bbox_inches="tight", facecolor="white", pad_inches=0.08)
-    buf.seek(0)
-    plt.close(fig)
-    return buf
+    fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight", facecolor="white", pad_inches=0.08)
+    return buf.getvalue()
 
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def generate_multi_channel_charts(channel_data: Dict[str, pd.DataFrame],
-                                  height: int = 350) -> Dict[str, BytesIO]:
+                                  height: int = 350,
+                                  dpi: int = 180,
+                                  style: Literal["decorated", "minimal"] = "decorated") -> Dict[str, bytes]:
     """
     Generate 3D pie charts for multiple channels
     
     Args:
         channel_data: Dictionary mapping channel names to DataFrames
         height: Not used for matplotlib, kept for compatibility
+        dpi: Render resolution passed to generate_3d_beveled_pie_chart
+        style: "minimal" drops the decorative rim/bevel/band overlays
     
     Returns:
-        Dictionary mapping channel names to BytesIO image objects
+        Dictionary mapping channel names to PNG bytes
     """
     charts = {}
     
     for channel_name, df in channel_data.items():
-        img_buffer = generate_3d_beveled_pie_chart(
+        # Empty channels have nothing to draw; skip hashing/rendering them
+        if df is None or df.empty or len(df.columns) == 0:
+            charts[channel_name] = b""
+            continue
+
+        png_bytes = generate_3d_beveled_pie_chart(
             df,
             channel_name=f"{channel_name}",
             title="Usage by Country",
             subtitle="",
-            target_percentage=0.70
+            target_percentage=0.70,
+            dpi=dpi,
+            style=style
         )
-        charts[channel_name] = img_buffer
+        charts[channel_name] = png_bytes
     
     return charts
 
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def generate_channel_airtime_pie(
     df: pd.DataFrame,
     title: str = "Time on air by channel",
     subtitle: str = "Material under 30 days",
-) -> BytesIO:
+    cols: Dict = None,
+    dpi: int = 180,
+    style: Literal["decorated", "minimal"] = "decorated",
+) -> bytes:
     """
     Generate projected 3D pie chart showing airtime distribution by channel.
     Same visual style as the country distribution chart (projected disk, front wall only,
@@ -365,45 +463,38 @@ def generate_channel_airtime_pie(
         df: DataFrame with Channel, Detection duration, Asset age columns
         title: Chart title
         subtitle: Chart subtitle
+        cols: Column lookup from prepare_bottom_left_data (optional)
+        dpi: Render resolution (180 for the PowerPoint; lower for screen)
+        style: "minimal" drops the decorative rim/bevel/band overlays
 
     Returns:
-        BytesIO object with PNG image
+        PNG bytes (b"" when there is no airtime data)
     """
-    import numpy as np
-    import matplotlib.pyplot as plt
-    from matplotlib.patches import Wedge, Polygon
-    from matplotlib.transforms import Affine2D
-    from utils.data_processing import calculate_channel_airtime
+    if df is None or df.empty:
+        return b""
 
     # --- Prepare data ---
-    df_chart = calculate_channel_airtime(df, max_age_days=30)
+    df_chart = calculate_channel_airtime(df, max_age_days=30, cols=cols)
 
     if df_chart.empty or len(df_chart) == 0:
-        return BytesIO()
+        return b""
 
     channels = df_chart["Channel"].astype(str).tolist()
     durations = df_chart["Duration"].astype(float).tolist()
 
     total = sum(durations)
     if total == 0:
-        return BytesIO()
-
-    percents = [d / total * 100 for d in durations]
+        return b""
 
     # Sort so smaller slices are at the front, bigger at the back (NRK look)
+    # Per-slice data is kept as parallel arrays rather than a list of tuples
     order = np.argsort(durations)  # ascending: small -> large
     channels = [channels[i] for i in order]
-    durations = [durations[i] for i in order]
-    percents = [percents[i] for i in order]
-
-    # Colors (reuse PIE_COLORS, repeat if needed)
-    colors_hex = (PIE_COLORS * ((len(channels) // len(PIE_COLORS)) + 1))[: len(channels)]
-
-    def hx2rgb01(h):
-        h = h.lstrip("#")
-        return tuple(int(h[i : i + 2], 16) / 255.0 for i in (0, 2, 4))
+    durations = np.asarray(durations)[order]
+    percents = durations / total * 100
 
-    colors_rgb = [hx2rgb01(h) for h in colors_hex]
+    # Colors (pre-converted palette, repeat if needed) as an (N, 3) array
+    colors_rgb = _slice_colors(len(channels))
 
     # --- Geometry / projection params (match the NRK-style chart you liked) ---
     R = 1.0
@@ -420,7 +511,10 @@ def generate_channel_airtime_pie(
     inside_min_angle_deg = 18.0  # >= this angle => label inside, else outside
 
     # --- Matplotlib figure ---
-    fig, ax = plt.subplots(figsize=(10.0, 6.2), dpi=180)
+    # Standalone Figure (not registered with pyplot): no global figure
+    # manager to create/tear down, and safe across concurrent sessions
+    fig = Figure(figsize=(10.0, 6.2), dpi=dpi)
+    ax = fig.subplots()
     fig.patch.set_facecolor("white")
     ax.set_aspect("equal")
     ax.axis("off")
@@ -428,95 +522,55 @@ def generate_channel_airtime_pie(
     # Transform circle -> ellipse
     to_ellipse = Affine2D().scale(1.0, y_scale) + ax.transData
 
-    def norm(a):
-        a = a % 360.0
-        return a if a >= 0 else a + 360.0
-
-    def ang_sweep(a1, a2, step=2.0, cw=True):
-        if cw:
-            a2 = a1 - ((a1 - a2) % 360.0)
-            if a2 > a1:
-                a2 -= 360.0
-            arr = np.arange(a1, a2 - 1e-6, -step)
-            if arr[-1] != a2:
-                arr = np.append(arr, a2)
-        else:
-            a2 = a1 + ((a2 - a1) % 360.0)
-            if a2 < a1:
-                a2 += 360.0
-            arr = np.arange(a1, a2 + 1e-6, step)
-            if arr[-1] != a2:
-                arr = np.append(arr, a2)
-        return arr
-
-    # Build slice angle ranges
-    theta = start_angle
-    slices = []
-    for ch, dur, pct, col in zip(channels, durations, percents, colors_rgb):
-        ang = (dur / total) * 360.0
-        t1, t2 = theta, (theta - ang if clockwise else theta + ang)
-        slices.append((ch, pct, col, t1, t2))
-        theta = t2
-
-    # 1) Draw flat top wedges (no radial/spherical shading)
-    for ch, pct, col, t1, t2 in slices:
-        w = Wedge(center, R, t2, t1, facecolor=col, edgecolor="#1a1a1a", linewidth=0.6)
-        w.set_transform(to_ellipse)
-        ax.add_patch(w)
+    # Build slice angle ranges (once, shared by every layer and the labels)
+    angs, t1s, t2s, mids = _slice_angles(durations, total, start_angle, clockwise)
+
+    # 1) Draw flat top wedges (no radial/spherical shading), one collection
+    tops = PatchCollection(
+        [Wedge(center, R, t2, t1) for t1, t2 in zip(t1s, t2s)],
+        facecolors=colors_rgb,
+        edgecolors="#1a1a1a",
+        linewidths=0.6,
+        transform=to_ellipse,
+    )
+    ax.add_collection(tops, autolim=False)
 
     # 2) Draw front-only side wall (constant darker shade -> disk, not sphere)
-    for ch, pct, col, t1, t2 in slices:
-        arc = ang_sweep(t1, t2, step=2.0, cw=clockwise)
-        vis = []
-        for a in arc:
-            d = np.deg2rad((norm(a - front_dir_deg) + 180) % 360 - 180)
-            if abs(d) <= np.pi / 2:  # front half only
-                vis.append((a, d))
-        if len(vis) < 2:
+    sides, walled = [], []
+    for i, (t1, t2) in enumerate(zip(t1s, t2s)):
+        poly_pts = _front_wall_points(t1, t2, R, y_scale, wall_px, front_dir_deg, clockwise)
+        if poly_pts is None:
             continue
 
-        top_edge = []
-        bot_edge = []
-        for a, d in vis:
-            x = R * np.cos(np.deg2rad(a))
-            y_top = R * np.sin(np.deg2rad(a)) * y_scale
-            y_bot = y_top - wall_px  # constant wall height
-            top_edge.append((x, y_top))
-            bot_edge.append((x, y_bot))
-
-        poly_pts = top_edge + bot_edge[::-1]
-        side = Polygon(
-            poly_pts,
-            closed=True,
-            facecolor=tuple(c * 0.55 for c in col),  # darker side
-            edgecolor="none",
-            linewidth=0,
-        )
-        ax.add_patch(side)
+        sides.append(Polygon(poly_pts, closed=True))
+        walled.append(i)
+    side_colors = colors_rgb[walled] * 0.55  # darker side
+    ax.add_collection(
+        PatchCollection(sides, facecolors=side_colors, edgecolors="none", linewidths=0),
+        autolim=False,
+    )
 
-    # 3) Thin outer rim
-    rim = Wedge(center, R * 1.006, 0, 360, facecolor="none", edgecolor="#0d0d0d", linewidth=0.6)
-    rim.set_transform(to_ellipse)
-    ax.add_patch(rim)
+    if style == "decorated":
+        # 3) Thin outer rim
+        rim = Wedge(center, R * 1.006, 0, 360, facecolor="none", edgecolor="#0d0d0d", linewidth=0.6)
+        rim.set_transform(to_ellipse)
+        ax.add_patch(rim)
 
-    # 4) Tiny center bevel (very subtle so it stays a disk, not a dome)
-    bevel = Wedge(center, R * 0.14, 0, 360, facecolor="#000000", edgecolor="none", linewidth=0)
-    bevel.set_alpha(0.07)
-    bevel.set_transform(to_ellipse)
-    ax.add_patch(bevel)
+        # 4) Tiny center bevel (very subtle so it stays a disk, not a dome)
+        bevel = Wedge(center, R * 0.14, 0, 360, facecolor="#000000", edgecolor="none", linewidth=0)
+        bevel.set_alpha(0.07)
+        bevel.set_transform(to_ellipse)
+        ax.add_patch(bevel)
 
-    # Optional: whisper-light back highlight band (keeps it NRK-ish but still flat)
-    back_band = Wedge(center, R * 1.00, 110, 70, facecolor="#ffffff", edgecolor="none")
-    back_band.set_alpha(0.03)
-    back_band.set_transform(to_ellipse)
-    ax.add_patch(back_band)
+        # Optional: whisper-light back highlight band (keeps it NRK-ish but still flat)
+        back_band = Wedge(center, R * 1.00, 110, 70, facecolor="#ffffff", edgecolor="none")
+        back_band.set_alpha(0.03)
+        back_band.set_transform(to_ellipse)
+        ax.add_patch(back_band)
 
     # --- Labels (inside for big slices, outside w/ elbow for small), same text style as before ---
-    theta = start_angle
-    for ch, dur, pct, col in zip(channels, durations, percents, colors_rgb):
-        ang = (dur / total) * 360.0
-        t1, t2 = theta, (theta - ang if clockwise else theta + ang)
-        mid = np.deg2rad((t1 + t2) / 2.0)
+    leaders = []
+    for ch, pct, col, ang, mid in zip(channels, percents, colors_rgb, angs, mids):
         ang_abs = abs(ang)
 
         # point on ellipse for leader start
@@ -533,9 +587,8 @@ def generate_channel_airtime_pie(
                 ha="center",
                 va="center",
                 fontsize=10,
-                fontweight="bold",
+                fontproperties=_PIE_FONT,
                 color="white",
-                fontfamily="Arial",
                 zorder=10,
             )
         elif pct >= min_label_pct:
@@ -546,8 +599,8 @@ def generate_channel_airtime_pie(
             x2 = x1 + (0.22 if to_right else -0.22)
             y2 = y1
 
-            # elbow leader line
-            ax.plot([rx, x1, x2], [ry, y1, y2], color="#444", linewidth=1.0, zorder=999)
+            # elbow leader line (drawn with the others after the loop)
+            leaders.append([(rx, ry), (x1, y1), (x2, y2)])
 
             ha = "left" if to_right else "right"
             ax.text(
@@ -557,9 +610,8 @@ def generate_channel_airtime_pie(
                 ha=ha,
                 va="center",
                 fontsize=9.5,
-                fontweight="bold",
+                fontproperties=_PIE_FONT,
                 color="white",
-                fontfamily="Arial",
                 bbox=dict(
                     boxstyle="round,pad=0.28",
                     facecolor=col,
@@ -570,14 +622,17 @@ def generate_channel_airtime_pie(
                 zorder=1000,
             )
 
-        theta = t2
+    if leaders:
+        ax.add_collection(LineCollection(leaders, colors="#444", linewidths=1.0,
+                                         capstyle="projecting", joinstyle="round",
+                                         zorder=999), autolim=False)
 
     # --- Bounds & title ---
     ax.set_xlim(-1.6, 1.6)
     ax.set_ylim(-1.25, 1.05)
 
     full_title = f"{title}\n{subtitle}" if subtitle else title
-    plt.title(
+    ax.set_title(
         full_title,
         fontsize=16,
         fontfamily="Arial",
@@ -588,19 +643,17 @@ def generate_channel_airtime_pie(
 
     # --- Export to BytesIO ---
     img_buffer = BytesIO()
-    plt.savefig(
+    fig.savefig(
         img_buffer,
         format="png",
-        dpi=180,
+        dpi=dpi,
         bbox_inches="tight",
         facecolor="white",
         edgecolor="none",
         pad_inches=0.05,
     )
-    img_buffer.seek(0)
-    plt.close(fig)
 
-    return img_buffer
+    return img_buffer.getvalue()
 
 def create_slug_visualization(top_slugs: List[Dict],   
                               context: str = "",  
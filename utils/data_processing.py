@@ -2,11 +2,38 @@
 Data processing utilities for Teletrax data  
 """
   
+import hashlib
+import numpy as np
 import pandas as pd  
-from collections import Counter  
+import pyarrow as pa
+import pyarrow.compute as pc
+import streamlit as st
+from io import BytesIO
 from typing import List, Dict, Tuple  
 import re
 
+
+def hash_dataframe(df) -> bytes:
+    """
+    Content hash of a DataFrame or Series (values, index and labels)
+
+    Used as the st.cache_data hash function for DataFrame/Series arguments so
+    every row takes part in the cache key.
+    """
+    labels = list(df.columns) if isinstance(df, pd.DataFrame) else [df.name]
+    digest = hashlib.sha256(pd.util.hash_pandas_object(df).values.tobytes())
+    digest.update(repr(labels).encode())
+    return digest.digest()
+
+
+DATAFRAME_HASH_FUNCS = {pd.DataFrame: hash_dataframe, pd.Series: hash_dataframe}
+
+# 'X days HH:MM:SS', 'X days MM:SS', 'HH:MM:SS' or 'MM:SS'
+_TIMESPAN_PATTERN = (
+    r'(?i)^(?:(?P<days>\d+)\s*days?\s+)?(?:(?P<hours>\d+)\s*:\s*)?'
+    r'(?P<minutes>\d+)\s*:\s*(?P<seconds>\d+)$'
+)
+
 def find_column(df, possible_names):  
     """Find a column by trying multiple possible names"""  
     for name in possible_names:  
@@ -14,6 +41,14 @@ def find_column(df, possible_names):
             return name  
     return None  
 
+def find_column_containing(df, *parts):
+    """Find the first column whose lowercased name contains every part"""
+    for col in df.columns:
+        col_lower = str(col).lower()
+        if all(part in col_lower for part in parts):
+            return col
+    return None
+
 def load_data_file(file, file_type='auto'):  
     """  
     Load data from uploaded file (Excel or CSV)
@@ -27,12 +62,32 @@ def load_data_file(file, file_type='auto'):
 
     """  
     if file_type == 'auto':  
-        file_type = 'excel' if file.name.endswith('.xlsx') else 'csv'
-      
-    if file_type == 'excel':  
-        return pd.read_excel(file)  
-    else:  
-        return pd.read_csv(file)
+        file_type = 'excel' if file.name.endswith(('.xlsx', '.xls')) else 'csv'
+
+    # Key the parse on the file contents so repeated "Generate" clicks
+    # reuse the already parsed DataFrame
+    return _load_cached(file.name, file.getvalue(), file_type)
+
+
+@st.cache_data(show_spinner=False)
+def _load_cached(name: str, data: bytes, file_type: str) -> pd.DataFrame:
+    """Parse raw file bytes into a DataFrame (cached on name + contents)"""
+    buffer = BytesIO(data)
+
+    if file_type == 'excel':
+        try:
+            # Rust-based calamine reader is several times faster than openpyxl
+            return pd.read_excel(buffer, engine='calamine')
+        except Exception:
+            # python-calamine missing or unable to read this workbook
+            buffer.seek(0)
+            return pd.read_excel(buffer, engine='openpyxl')
+    else:
+        try:
+            return pd.read_csv(buffer, engine='pyarrow')
+        except Exception:
+            buffer.seek(0)
+            return pd.read_csv(buffer)
 
   
 def extract_masterslug(slug_text: str) -> str:  
@@ -71,6 +126,7 @@ def extract_masterslug(slug_text: str) -> str:
         return ""
 
   
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def extract_top_masterslugs(df: pd.DataFrame, top_n: int = 3) -> Tuple[List[Dict], int]:  
     """  
     Extract top N masterslugs from raw data  
@@ -84,41 +140,34 @@ def extract_top_masterslugs(df: pd.DataFrame, top_n: int = 3) -> Tuple[List[Dict
         Tuple of (list of top masterslugs with percentages, total count)  
     """  
     # Find the slug line column (case-insensitive search)  
-    slug_column = None
-      
-    for col in df.columns:  
-        if 'slug' in str(col).lower():  
-            slug_column = df[col]  
-            break
+    slug_col = find_column_containing(df, 'slug')
       
     # If no column named 'slug', fall back to first column  
-    if slug_column is None:  
-        slug_column = df.iloc[:, 0]
+    slug_column = df[slug_col] if slug_col is not None else df.iloc[:, 0]
       
-    # Extract masterslugs  
-    masterslugs = slug_column.dropna().apply(extract_masterslug)
+    # Count each distinct slug line once, then extract masterslugs per
+    # distinct value instead of per row (first-seen order kept for ties)
+    slug_counts = slug_column.value_counts(sort=False, dropna=True)
+    masterslugs = slug_counts.index.map(extract_masterslug)
+    masterslug_counts = slug_counts.groupby(masterslugs, sort=False).sum()
       
     # Remove empty masterslugs  
-    masterslugs = masterslugs[masterslugs != ""]
-      
-    # Count occurrences  
-    masterslug_counts = Counter(masterslugs)
+    masterslug_counts = masterslug_counts[masterslug_counts.index != ""]
       
     # Get top N  
-    top_masterslugs = masterslug_counts.most_common(top_n)
+    top_masterslugs = masterslug_counts.sort_values(ascending=False, kind='stable').head(top_n)
       
     # Calculate total for percentages  
-    total = sum(masterslug_counts.values())
-      
-    # Format results  
-    results = []  
-    for masterslug, count in top_masterslugs:  
-        percentage = (count / total) * 100 if total > 0 else 0  
-        results.append({  
-            'slug': str(masterslug),  
-            'count': count,  
-            'percentage': percentage  
-        })
+    total = int(masterslug_counts.sum())
+      
+    # Format results (percentages computed for the top N in one go)  
+    percentages = top_masterslugs / total * 100 if total > 0 else top_masterslugs * 0  
+    results = [  
+        {'slug': str(masterslug), 'count': int(count), 'percentage': float(percentage)}  
+        for masterslug, count, percentage in zip(  
+            top_masterslugs.index, top_masterslugs.to_numpy(), percentages.to_numpy()  
+        )  
+    ]
       
     return results, total
 
@@ -150,6 +199,7 @@ def format_stats_text(edits: int, lives_on_air: int, total_lives: int,
     return stats_text
 
   
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def prepare_country_data(df: pd.DataFrame, target_percentage: float = 0.70) -> pd.DataFrame:  
     """  
     Prepare country data for pie chart with smart grouping
@@ -166,19 +216,17 @@ def prepare_country_data(df: pd.DataFrame, target_percentage: float = 0.70) -> p
     if df is None or df.empty or len(df.columns) == 0:  
         return pd.DataFrame()
     
-    # Make a clean copy  
-    df_clean = df.copy()
-
-    # Check again after copy  
-    if df_clean.empty or len(df_clean.columns) == 0:  
-        return pd.DataFrame()
-      
     # Get column names  
-    location_col = df_clean.columns[0]  
-    hits_col = df_clean.columns[1]
+    location_col = df.columns[0]  
+    hits_col = df.columns[1]
       
-    # Remove rows with 'Unmatched' or 'XX' in the location code (case-insensitive)  
-    df_clean = df_clean[~df_clean[location_col].astype(str).str.upper().isin(['UNMATCHED', 'XX'])]
+    # Remove rows with 'Unmatched' or 'XX' in the location code (case-insensitive);  
+    # only the distinct codes are upper-cased, rows are masked via their codes.  
+    # The row filter already yields a new frame, so the input is never copied whole  
+    codes, uniques = pd.factorize(df[location_col])  
+    unmatched = pd.Index(uniques).astype(str).str.upper().isin(['UNMATCHED', 'XX'])  
+    # Code -1 (missing) picks the trailing False, as str(NaN) never matched  
+    df_clean = df[~np.append(unmatched, False)[codes]]
       
     # Ensure hits column is numeric  
     df_clean[hits_col] = pd.to_numeric(df_clean[hits_col], errors='coerce')  
@@ -193,27 +241,21 @@ def prepare_country_data(df: pd.DataFrame, target_percentage: float = 0.70) -> p
     if total_hits == 0:  
         return df_sorted
       
-    # Find top countries that account for ~70% of usage  
-    cumulative_sum = 0  
-    top_n = 0
-      
-    for idx in range(len(df_sorted)):  
-        cumulative_sum += df_sorted.loc[idx, hits_col]  
-        top_n += 1
-          
-        # Stop when we reach target percentage or max 8 countries  
-        if (cumulative_sum / total_hits >= target_percentage) or (top_n >= 8):  
-            break
+    # Find top countries that account for ~70% of usage (max 8): one  
+    # cumulative sum over the 8 largest instead of a row-by-row loop  
+    top_share = df_sorted[hits_col].head(8).cumsum().to_numpy() / total_hits  
+    reached = np.flatnonzero(top_share >= target_percentage)  
+    top_n = int(reached[0]) + 1 if len(reached) else len(top_share)
       
     # Ensure at least 5 countries if available  
-    top_n = max(min(top_n, len(df_sorted)), min(5, len(df_sorted)))
+    top_n = max(top_n, min(5, len(df_sorted)))
       
     # Take top N countries  
-    top_countries = df_sorted.head(top_n).copy()
+    top_countries = df_sorted.head(top_n)
       
     # Group the rest as "Rest of World"  
     if len(df_sorted) > top_n:  
-        rest_sum = df_sorted.iloc[top_n:][hits_col].sum()
+        rest_sum = df_sorted[hits_col].iloc[top_n:].sum()
           
         if rest_sum > 0:  
             # Create rest of world row with same column structure  
@@ -251,10 +293,28 @@ def validate_data_structure(df: pd.DataFrame, expected_columns: int = 2) -> bool
       
     return True
 
+def _to_utc_datetime(series: pd.Series) -> pd.Series:
+    """
+    Column as UTC datetimes (unparseable values become NaT)
+
+    Columns the CSV/Excel readers already typed as datetimes are only
+    localized/converted, not re-parsed value by value.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        if series.dt.tz is None:
+            return series.dt.tz_localize('UTC')
+        return series.dt.tz_convert('UTC')
+    return pd.to_datetime(series, errors="coerce", utc=True)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def get_earliest_date(df: pd.DataFrame) -> str:
     """
     Get the earliest date from the dataset.
 
+    Each candidate column is parsed in one vectorized pd.to_datetime call;
+    the result is cached on the DataFrame contents.
+
     Preference:
     1) A column whose name matches UTC detection start (e.g. 'UTC detection start')
     2) Any column with 'date', 'time', 'timestamp', or 'detection start' in its name
@@ -277,7 +337,7 @@ def get_earliest_date(df: pd.DataFrame) -> str:
         col_lower = str(col).lower()
         if any(pat in col_lower for pat in preferred_patterns):
             try:
-                parsed = pd.to_datetime(df[col], errors="coerce", utc=True)
+                parsed = _to_utc_datetime(df[col])
                 if parsed.notna().any():
                     date_series = parsed
                     break
@@ -290,7 +350,7 @@ def get_earliest_date(df: pd.DataFrame) -> str:
             col_lower = str(col).lower()
             if any(keyword in col_lower for keyword in ["date", "time", "timestamp", "detection start"]):
                 try:
-                    parsed = pd.to_datetime(df[col], errors="coerce", utc=True)
+                    parsed = _to_utc_datetime(df[col])
                     if parsed.notna().any():
                         date_series = parsed
                         break
@@ -300,7 +360,7 @@ def get_earliest_date(df: pd.DataFrame) -> str:
     # 3) Fallback to first column, if nothing else worked
     if date_series is None and len(df.columns) > 0:
         try:
-            parsed = pd.to_datetime(df.iloc[:, 0], errors="coerce", utc=True)
+            parsed = _to_utc_datetime(df.iloc[:, 0])
             if parsed.notna().any():
                 date_series = parsed
         except Exception:
@@ -320,80 +380,63 @@ def get_earliest_date(df: pd.DataFrame) -> str:
     # Fallback: just return current year (or whatever default you want)
     return "2024"
 
-def calculate_channel_airtime(df: pd.DataFrame, max_age_days: int = 30) -> pd.DataFrame:  
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
+def calculate_channel_airtime(df: pd.DataFrame, max_age_days: int = 30,
+                              cols: Dict = None) -> pd.DataFrame:  
     """  
     Calculate airtime distribution by channel for content under X days old
       
     Args:  
         df: DataFrame with Channel, Detection duration, Asset age columns  
         max_age_days: Maximum asset age in days (default 30)
+        cols: Column lookup from prepare_bottom_left_data (optional; columns
+            are discovered by name when omitted)
       
     Returns:  
         DataFrame with Channel and Duration columns  
     """  
-    # Find channel column  
-    channel_col = None  
-    for col in df.columns:  
-        col_lower = str(col).lower()  
-        if 'channel' in col_lower:  
-            channel_col = col  
-            break
-      
-    # Find detection duration column  
-    duration_col = None  
-    for col in df.columns:  
-        col_lower = str(col).lower()  
-        if 'detection' in col_lower and 'duration' in col_lower:  
-            duration_col = col  
-            break
-      
-    # Find asset age column  
-    age_col = None  
-    for col in df.columns:  
-        col_lower = str(col).lower()  
-        if 'asset' in col_lower and 'age' in col_lower:  
-            age_col = col  
-            break
+    if cols is None:
+        channel_col = find_column_containing(df, 'channel')
+        duration_col = find_column_containing(df, 'detection', 'duration')
+        age_col = find_column_containing(df, 'asset', 'age')
+    else:
+        channel_col = cols.get('channel')
+        duration_col = cols.get('duration')
+        age_col = cols.get('age')
       
     # If any required column is missing, return empty  
     if not all([channel_col, duration_col, age_col]):  
         return pd.DataFrame()
       
-    # Filter for age < 30 days  
-    df_filtered = df.copy()
-      
-    # Convert asset age to days  
-    df_filtered['age_days'] = df_filtered[age_col].apply(  
-        lambda x: parse_timespan_to_seconds(x) / 86400 if pd.notna(x) else 999  
-    )
-      
-    # Filter for assets under 30 days  
-    df_filtered = df_filtered[df_filtered['age_days'] < max_age_days]
-      
-    # Calculate total duration per channel  
-    channel_durations = {}
-      
-    for channel in df_filtered[channel_col].unique():  
-        if pd.isna(channel) or str(channel).strip() == '':  
-            continue
-              
-        channel_data = df_filtered[df_filtered[channel_col] == channel]
-          
-        # Sum all durations for this channel  
-        total_seconds = 0  
-        for dur in channel_data[duration_col].dropna():  
-            total_seconds += parse_timespan_to_seconds(dur)
-          
-        if total_seconds > 0:  
-            channel_durations[str(channel).strip()] = total_seconds
+    # Convert asset age to days (missing ages never qualify)
+    if '_age_sec' in df.columns:
+        age_seconds = df['_age_sec']
+    else:
+        age_seconds = parse_timespan_series(df[age_col])
+    age_days = (age_seconds / 86400).where(df[age_col].notna(), 999)
+      
+    # Keep assets under max_age_days on a named (non-blank) channel  
+    recent = df[age_days < max_age_days]
+      
+    # Total duration per channel in one groupby (first-seen channel order,  
+    # missing channels dropped), then merge names that only differ by  
+    # surrounding whitespace on the small per-channel result  
+    if '_dur_sec' in df.columns:
+        durations = recent['_dur_sec']
+    else:
+        durations = parse_timespan_series(recent[duration_col])
+    per_channel = durations.groupby(recent[channel_col], sort=False, observed=True).sum()
+    names = per_channel.index.astype(str).str.strip()
+    channel_durations = per_channel.groupby(names, sort=False).sum()
+    channel_durations = channel_durations[(channel_durations.index != '') & (channel_durations > 0)]
       
     # Create result dataframe  
-    if not channel_durations:  
+    if channel_durations.empty:  
         return pd.DataFrame()
       
     result = pd.DataFrame({  
-        'Channel': list(channel_durations.keys()),  
-        'Duration': list(channel_durations.values())  
+        'Channel': channel_durations.index.to_numpy(dtype=object),  
+        'Duration': channel_durations.to_numpy()  
     })
       
     # Sort by duration descending  
@@ -454,7 +497,72 @@ def parse_timespan_to_seconds(timespan_str: str) -> int:
     except Exception as e:  
         return 0  
 
+
+def parse_timespan_series(series: pd.Series) -> pd.Series:
+    """
+    Vectorized parse_timespan_to_seconds for a whole column
+
+    Timespans are matched with a single Arrow regex kernel instead of calling
+    the scalar parser once per row; only unmatched values go through the
+    plain-number fallback. String columns are handed to Arrow without a
+    Python-level str() round trip, and numeric or time-of-day columns (the
+    pyarrow CSV engine reads HH:MM:SS as time) skip the regex entirely.
+
+    Args:
+        series: Column of timespan values (e.g. 'Asset age (time span)')
+
+    Returns:
+        int64 Series of seconds aligned with the input index (0 if unparseable)
+    """
+    seconds = np.zeros(len(series), dtype=np.int64)
+
+    # Plain numbers are already seconds
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        _fill_plain_seconds(seconds, np.arange(len(series)), series.to_numpy(dtype=float, na_value=np.nan))
+        return pd.Series(seconds, index=series.index)
+
+    try:
+        values = pa.array(series, from_pandas=True)
+    except (pa.ArrowException, TypeError, ValueError):
+        values = None
+
+    if values is not None and pa.types.is_time(values.type):
+        # Time of day: whole seconds since midnight ('HH:MM:SS.ffffff' never
+        # parsed as a timespan, so sub-second values stay 0)
+        micros = pc.cast(pc.cast(values, pa.time64('us')), pa.int64()).to_numpy(zero_copy_only=False)
+        micros = np.nan_to_num(micros, nan=-1).astype(np.int64)
+        whole = (micros >= 0) & (micros % 1_000_000 == 0)
+        seconds[whole] = micros[whole] // 1_000_000
+        return pd.Series(seconds, index=series.index)
+
+    if values is None or not (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+        values = pa.array(series.astype(str), type=pa.string(), from_pandas=True)
+
+    text = pc.utf8_trim_whitespace(values)
+    parts = pc.extract_regex(text, _TIMESPAN_PATTERN)
+
+    for name, factor in (('days', 86400), ('hours', 3600), ('minutes', 60), ('seconds', 1)):
+        digits = pc.struct_field(parts, name)
+        # Optional groups that did not participate come back as ''
+        digits = pc.if_else(pc.equal(digits, ''), None, digits)
+        seconds += pc.cast(digits, pa.int64()).fill_null(0).to_numpy() * factor
+
+    # Try parsing the rest as plain numbers (seconds)
+    unmatched = np.flatnonzero(~parts.is_valid().to_numpy(zero_copy_only=False))
+    if len(unmatched):
+        plain = pd.to_numeric(pd.Series(text.take(unmatched).to_pylist(), dtype=object), errors='coerce')
+        _fill_plain_seconds(seconds, unmatched, plain.to_numpy(dtype=float, na_value=np.nan))
+
+    return pd.Series(seconds, index=series.index)
+
+
+def _fill_plain_seconds(seconds: np.ndarray, positions: np.ndarray, plain: np.ndarray) -> None:
+    """Write truncated finite plain-number seconds into seconds[positions]"""
+    finite = np.isfinite(plain)
+    seconds[positions[finite]] = np.trunc(plain[finite]).astype(np.int64)
+
   
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def calculate_total_detection_length(df: pd.DataFrame) -> str:  
     """  
     Calculate total detection length from Detection duration column  
@@ -464,12 +572,18 @@ def calculate_total_detection_length(df: pd.DataFrame) -> str:
     if duration_col_name not in df.columns:  
         return "00:00:00"
       
-    total_seconds = 0
-      
-    for duration in df[duration_col_name].dropna():  
-        seconds = parse_timespan_to_seconds(duration)  
-        total_seconds += seconds
-      
+    if '_dur_sec' in df.columns:
+        total_seconds = int(df['_dur_sec'].sum())
+    else:
+        total_seconds = int(parse_timespan_series(df[duration_col_name].dropna()).sum())
+
+    return format_seconds_hms(total_seconds)
+
+
+def format_seconds_hms(total_seconds: int) -> str:
+    """
+    Format a number of seconds as HH:MM:SS (hours are not capped at 24)
+    """
     if total_seconds == 0:  
         return "00:00:00"
       
@@ -481,6 +595,7 @@ def calculate_total_detection_length(df: pd.DataFrame) -> str:
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
   
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def calculate_lives_on_air(df: pd.DataFrame, max_duration_seconds: int = 180,   
                           use_unique_assets: bool = True) -> int:  
     """  
@@ -498,33 +613,24 @@ def calculate_lives_on_air(df: pd.DataFrame, max_duration_seconds: int = 180,
     if use_unique_assets and headline_col_name not in df.columns:  
         return 0
       
-    qualifying_assets = set()
-      
-    for idx in df.index:  
-        try:  
-            # Check if LIVE  
-            service = str(df.loc[idx, service_col_name]).strip().upper()  
-            if service != 'LIVE':  
-                continue
-              
-            # Get asset age  
-            asset_age = df.loc[idx, asset_age_col_name]  
-            age_seconds = parse_timespan_to_seconds(asset_age)
-              
-            # Check if under threshold  
-            if age_seconds < max_duration_seconds:  
-                if use_unique_assets:  
-                    headline = str(df.loc[idx, headline_col_name]).strip()  
-                    if headline and headline.lower() not in ['nan', 'none', '']:  
-                        qualifying_assets.add(headline)  
-                else:  
-                    qualifying_assets.add(idx)  
-        except Exception as e:  
-            continue
-      
-    return len(qualifying_assets)
+    # LIVE rows with asset age under the threshold
+    live_mask = _live_mask(df, service_col_name)
+    if '_age_sec' in df.columns:
+        age_seconds = df['_age_sec']
+    else:
+        age_seconds = parse_timespan_series(df[asset_age_col_name])
+    qualifying = live_mask & (age_seconds < max_duration_seconds)
+
+    if use_unique_assets:
+        # Only the headline column of the qualifying rows is materialized
+        headlines = df.loc[qualifying, headline_col_name].astype(str).str.strip()
+        headlines = headlines[~headlines.str.lower().isin(['nan', 'none', ''])]
+        return int(headlines.nunique())
+    else:
+        return int(qualifying.sum())
 
   
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def calculate_total_lives(df: pd.DataFrame, use_unique_assets: bool = True) -> int:  
     """  
     Count unique Headlines with Service=LIVE (no age filter)  
@@ -539,18 +645,18 @@ def calculate_total_lives(df: pd.DataFrame, use_unique_assets: bool = True) -> i
         return 0
       
     # Filter for LIVE  
-    live_mask = df[service_col_name].astype(str).str.strip().str.upper() == 'LIVE'  
-    live_df = df[live_mask]
+    live_mask = _live_mask(df, service_col_name)
       
-    if use_unique_assets and headline_col_name in live_df.columns:  
+    if use_unique_assets:  
         # Count unique headlines (excluding NaN/empty)  
-        unique_headlines = live_df[headline_col_name].dropna()  
+        unique_headlines = df.loc[live_mask, headline_col_name].dropna()  
         unique_headlines = unique_headlines[unique_headlines.astype(str).str.strip() != '']  
         return int(unique_headlines.nunique())  
     else:  
-        return len(live_df)
+        return int(live_mask.sum())
 
   
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def calculate_total_edits(df: pd.DataFrame, use_unique_assets: bool = True) -> int:  
     """  
     Count unique Headlines where Service is NOT "LIVE"  
@@ -565,18 +671,18 @@ def calculate_total_edits(df: pd.DataFrame, use_unique_assets: bool = True) -> i
         return 0
       
     # Filter for non-LIVE  
-    non_live_mask = df[service_col_name].astype(str).str.strip().str.upper() != 'LIVE'  
-    non_live_df = df[non_live_mask]
+    non_live_mask = ~_live_mask(df, service_col_name)
       
-    if use_unique_assets and headline_col_name in non_live_df.columns:  
+    if use_unique_assets:  
         # Count unique headlines (excluding NaN/empty)  
-        unique_headlines = non_live_df[headline_col_name].dropna()  
+        unique_headlines = df.loc[non_live_mask, headline_col_name].dropna()  
         unique_headlines = unique_headlines[unique_headlines.astype(str).str.strip() != '']  
         return int(unique_headlines.nunique())  
     else:  
-        return len(non_live_df)
+        return int(non_live_mask.sum())
 
   
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def calculate_total_countries(df: pd.DataFrame) -> int:  
     """  
     Count unique countries from Location code column  
@@ -586,8 +692,148 @@ def calculate_total_countries(df: pd.DataFrame) -> int:
     if location_col_name not in df.columns:  
         return 0
       
+    return _count_countries(df[location_col_name])
+
+
+def _count_countries(locations: pd.Series) -> int:
+    """Count unique location codes, excluding Unmatched/XX/empty entries"""
+    # Categorical columns only need their (used) categories normalized
+    if isinstance(locations.dtype, pd.CategoricalDtype):
+        locations = pd.Series(locations.cat.remove_unused_categories().cat.categories)
+
     # Get unique values, excluding unwanted entries  
-    unique_countries = df[location_col_name].dropna().astype(str).str.strip().str.upper()  
+    unique_countries = locations.dropna().astype(str).str.strip().str.upper()  
     unique_countries = unique_countries[~unique_countries.isin(['UNMATCHED', 'XX', ''])]
       
-    return len(unique_countries.unique())  
\ No newline at end of file
+    return len(unique_countries.unique())
+
+
+def live_service_mask(service: pd.Series) -> pd.Series:
+    """
+    Boolean mask of rows whose Service is LIVE (case/whitespace-insensitive)
+
+    Only the distinct categories are normalized; the row mask is a gather
+    over the category codes, so no per-row strings are allocated.
+
+    Args:
+        service: Service column (any dtype; converted to category if needed)
+
+    Returns:
+        Boolean Series aligned with service (missing values are not LIVE)
+    """
+    if not isinstance(service.dtype, pd.CategoricalDtype):
+        service = service.astype('category')
+    is_live = service.cat.categories.astype(str).str.strip().str.upper() == 'LIVE'
+    # Code -1 (missing) picks the trailing False
+    mask = np.append(np.asarray(is_live, dtype=bool), False)[service.cat.codes.to_numpy()]
+    return pd.Series(mask, index=service.index, name=service.name)
+
+
+def _live_mask(df: pd.DataFrame, service_col: str) -> pd.Series:
+    """LIVE mask for df, reusing '_is_live' from prepare_bottom_left_data when present"""
+    if '_is_live' in df.columns:
+        return df['_is_live']
+    return live_service_mask(df[service_col])
+
+
+def prepare_bottom_left_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Resolve the bottom left columns and derive the shared helper columns once
+
+    Adds '_is_live' (see live_service_mask), '_age_sec' (asset age in
+    seconds) and '_dur_sec' (detection duration in seconds; both 0 when
+    unparseable) so the stats, debug view, airtime chart and PPT reuse them
+    instead of rebuilding them from the raw columns. The
+    low-cardinality Service, Location code and Channel columns are converted
+    to category dtype so unique counts and per-channel grouping work on codes.
+
+    Args:
+        df: Bottom left DataFrame as returned by load_data_file
+
+    Returns:
+        Tuple of (enriched DataFrame, dict of column names keyed by
+        service/headline/age/location/duration/channel; None when missing)
+    """
+    cols = {
+        'service': find_column(df, ['Service']),
+        'headline': find_column(df, ['Headline', 'Asset: Headline', 'Asset headline']),
+        'age': find_column(df, ['Asset age (time span)', 'Asset age (timespan)', 'Asset age']),
+        'location': find_column(df, ['Location code']),
+        'duration': find_column(df, ['Detection duration']),
+        'channel': find_column_containing(df, 'channel'),
+    }
+
+    derived = {
+        cols[key]: df[cols[key]].astype('category')
+        for key in ('service', 'location', 'channel') if cols[key]
+    }
+    if cols['service']:
+        derived['_is_live'] = live_service_mask(derived[cols['service']])
+    if cols['age']:
+        derived['_age_sec'] = parse_timespan_series(df[cols['age']])
+    if cols['duration']:
+        derived['_dur_sec'] = parse_timespan_series(df[cols['duration']])
+
+    return df.assign(**derived), cols
+
+
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
+def compute_bottom_left_stats(df: pd.DataFrame, max_duration_seconds: int = 180,
+                              cols: Dict = None) -> Dict:
+    """
+    Calculate all bottom left stats in a single pass over the DataFrame
+
+    Same results as calculate_total_edits, calculate_lives_on_air,
+    calculate_total_lives (all with use_unique_assets=True),
+    calculate_total_countries and calculate_total_detection_length, but the
+    normalized Service column, LIVE mask and headline filter are built once
+    and shared by every stat.
+
+    Args:
+        df: DataFrame with Service, Headline, Asset age (time span),
+            Location code and Detection duration columns, ideally already
+            enriched by prepare_bottom_left_data
+        max_duration_seconds: Asset age threshold for lives on air (default 180)
+        cols: Column lookup from prepare_bottom_left_data (resolved here when
+            omitted)
+
+    Returns:
+        Dictionary with total_edits, lives_on_air, total_lives,
+        total_countries and total_detection_length
+    """
+    if cols is None:
+        df, cols = prepare_bottom_left_data(df)
+
+    stats = {
+        'total_edits': 0,
+        'lives_on_air': 0,
+        'total_lives': 0,
+        'total_countries': 0,
+        'total_detection_length': "00:00:00",
+    }
+
+    if not cols['service']:
+        stats['total_edits'] = len(df)
+    elif cols['headline']:
+        live_mask = df['_is_live']
+        headlines = df[cols['headline']]
+
+        # Unique headlines (excluding NaN/empty) split by LIVE / non-LIVE
+        valid = headlines.notna() & (headlines.astype(str).str.strip() != '')
+        stats['total_edits'] = int(headlines[valid & ~live_mask].nunique())
+        stats['total_lives'] = int(headlines[valid & live_mask].nunique())
+
+        if cols['age']:
+            on_air = headlines[live_mask & (df['_age_sec'] < max_duration_seconds)].astype(str).str.strip()
+            on_air = on_air[~on_air.str.lower().isin(['nan', 'none', ''])]
+            stats['lives_on_air'] = int(on_air.nunique())
+
+    if cols['location']:
+        stats['total_countries'] = _count_countries(df[cols['location']])
+
+    if cols['duration']:
+        total_seconds = int(df['_dur_sec'].sum())
+        stats['total_detection_length'] = format_seconds_hms(total_seconds)
+
+    return stats
+  
\ No newline at end of file
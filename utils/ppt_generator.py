@@ -7,57 +7,260 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 from io import BytesIO
+import tempfile
+from PIL import Image
 import plotly.graph_objects as go
 from typing import Dict, List
-from config.colours import PIE_COLORS
 
-from utils.chart_generator import generate_channel_airtime_pie  
+from utils.chart_generator import generate_channel_airtime_pie, figure_to_png
+
+# Slide colours
+_ORANGE = RGBColor(217, 120, 71)
+_BORDER_GRAY = RGBColor(200, 200, 200)
+_TEXT_GRAY = RGBColor(100, 100, 100)
+_PLACEHOLDER_GRAY = RGBColor(150, 150, 150)
+_BG_GRAY = RGBColor(250, 250, 250)
+
+# Slide size and the layout grid shared by both decks
+SLIDE_WIDTH   = Inches(10)
+SLIDE_HEIGHT  = Inches(7.5)
+
+LEFT_MARGIN   = Inches(0.5)
+TOP_ROW_Y     = Inches(1.0)
+ROW_GAP       = Inches(0.5)
+BOX_WIDTH     = Inches(3.6)
+BOX_HEIGHT    = Inches(2.8)
+COL_GAP       = Inches(0.3)
+
+COL1_X        = LEFT_MARGIN
+COL2_X        = COL1_X + BOX_WIDTH + COL_GAP
+BOTTOM_ROW_Y  = TOP_ROW_Y + BOX_HEIGHT + ROW_GAP
+
+# Right column placeholder for manual images
+RIGHT_PLACEHOLDER_WIDTH = Inches(1.6)
+RIGHT_MARGIN            = Inches(0.3)
+RIGHT_PLACEHOLDER_X     = SLIDE_WIDTH - RIGHT_PLACEHOLDER_WIDTH - RIGHT_MARGIN
+
+# Time series chart layout size, and the pixel density it is exported at
+# for its box on the slide (2x a 72 dpi screen is plenty for a 3.6" box)
+TIME_SERIES_SIZE = (800, 600)
+SLIDE_IMAGE_DPI = 144
+
+def _template_bytes() -> bytes:
+    """Default template resized to the 10" x 7.5" slides every deck uses, as .pptx bytes"""
+    prs = Presentation()
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
+    buf = BytesIO()
+    prs.save(buf)
+    return buf.getvalue()
+
+
+# Parsed from memory for each deck instead of re-reading python-pptx's
+# default template from disk and resizing it every time
+_TEMPLATE_BYTES = _template_bytes()
+
+
+def _new_presentation() -> Presentation:
+    """Fresh 4:3 presentation built from the cached template"""
+    return Presentation(BytesIO(_TEMPLATE_BYTES))
+
 
 def hex_to_rgb(hex_color: str) -> tuple:
     """Convert hex color to RGB tuple"""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    return tuple(bytes.fromhex(hex_color.lstrip('#'))[:3])
+
+
+def _compact_png(png_bytes: bytes, colors: int = 256) -> bytes:
+    """
+    Shrink an opaque chart PNG by quantizing it to an indexed palette
+
+    Lossy, but flat-colored charts typically come out about a third of the
+    size with no visible difference. Transparent images, and any that don't
+    get smaller, are returned unchanged.
+
+    Args:
+        png_bytes: PNG image bytes
+        colors: Palette size (at most 256)
+
+    Returns:
+        PNG bytes
+    """
+    try:
+        img = Image.open(BytesIO(png_bytes))
+        if 'A' in img.getbands() and img.getchannel('A').getextrema() != (255, 255):
+            return png_bytes
+        out = BytesIO()
+        img.convert('RGB').quantize(colors).save(out, format='PNG')
+        return out.getvalue() if out.tell() < len(png_bytes) else png_bytes
+    except Exception:
+        return png_bytes
+
+
+def _picture_stream(image: BytesIO, compact: bool = False) -> BytesIO:
+    """Rewound image stream for add_picture, run through _compact_png if requested"""
+    image.seek(0)
+    if compact:
+        return BytesIO(_compact_png(image.read()))
+    return image
+
+
+def _place_bordered_picture(slide, image: BytesIO, x, y, width, height,
+                            compact: bool = False):
+    """
+    Add an image to a slide with the light gray border used for chart boxes
+
+    Args:
+        slide: Slide to add the picture to
+        image: Image stream (rewound before reading)
+        x, y: Position of the picture
+        width, height: Size of the picture
+        compact: Palette-compress the image first (see _compact_png)
+
+    Returns:
+        The added picture shape
+    """
+    image = _picture_stream(image, compact)
+    pic = slide.shapes.add_picture(image, x, y, width=width, height=height)
+    pic.line.color.rgb = _BORDER_GRAY
+    pic.line.width = Pt(1)
+    return pic
+
+
+def _add_image_placeholder(slide, x, y, width, height):
+    """Add the italic "[ Add images here ]" text box reserved for manual images"""
+    placeholder_box = slide.shapes.add_textbox(x, y, width, height)
+    placeholder_frame = placeholder_box.text_frame
+    placeholder_frame.text = "[ Add images here ]"
+    placeholder_para = placeholder_frame.paragraphs[0]
+    placeholder_para.font.size = Pt(10)
+    placeholder_para.font.italic = True
+    placeholder_para.font.color.rgb = _PLACEHOLDER_GRAY
+    placeholder_para.alignment = PP_ALIGN.CENTER
+    return placeholder_box
+
+
+def _set_stats_text(stats_box, stats_text: str):
+    """Fill the stats box, one bold 10pt Arial paragraph per line of stats_text"""
+    stats_frame = stats_box.text_frame
+    stats_frame.text = stats_text
+    stats_frame.word_wrap = True
+
+    for paragraph in stats_frame.paragraphs:
+        # Each .font access re-resolves the paragraph's run properties
+        font = paragraph.font
+        font.size = Pt(10)
+        font.name = 'Arial'
+        font.bold = True
+        paragraph.space_after = Pt(6)
+
+
+def _add_slug_box(slide, x, y, width, height, slug_data: Dict):
+    """
+    Add the top-slug box: a large orange percentage over its description
+
+    Args:
+        slide: Slide to add the box to
+        x, y: Position of the box
+        width, height: Size of the box
+        slug_data: Slug visualization data (percentage, clean_slug, earliest_date)
+
+    Returns:
+        The added text box shape
+    """
+    slug_box = slide.shapes.add_textbox(x, y, width, height)
+    # Add border
+    slug_box.line.color.rgb = _BORDER_GRAY
+    slug_box.line.width = Pt(1)
+    # Add subtle background
+    slug_box.fill.solid()
+    slug_box.fill.fore_color.rgb = _BG_GRAY
+
+    slug_frame = slug_box.text_frame
+    slug_frame.word_wrap = True
+    slug_frame.vertical_anchor = 1  # Center vertically
+
+    # Large percentage
+    p_pct = slug_frame.paragraphs[0]
+    p_pct.text = f"{slug_data['percentage']:.0f}%"
+    p_pct.font.size = Pt(72)
+    p_pct.font.bold = True
+    p_pct.font.name = 'Arial'
+    p_pct.font.color.rgb = _ORANGE
+    p_pct.alignment = PP_ALIGN.CENTER
+    p_pct.space_after = Pt(8)
+
+    # Text: "of detections since [date] about [slug]"
+    p_text = slug_frame.add_paragraph()
+    earliest_date = slug_data.get('earliest_date', '2024')
+    p_text.text = f"of detections since {earliest_date}\nabout {slug_data['clean_slug']}"
+    p_text.font.size = Pt(13)
+    p_text.font.name = 'Arial'
+    p_text.font.bold = False
+    p_text.font.color.rgb = _TEXT_GRAY
+    p_text.alignment = PP_ALIGN.CENTER
+    return slug_box
+
+
+def _time_series_png(fig_time: go.Figure, box_width) -> bytes:
+    """
+    Export the time series chart at the resolution its slide box needs
+
+    The chart keeps its 800x600 layout; only the rasterized pixel count is
+    scaled, so Kaleido doesn't render pixels PowerPoint would throw away.
+
+    Args:
+        fig_time: Plotly time series figure
+        box_width: Width of the picture on the slide (EMU length)
+
+    Returns:
+        PNG bytes
+    """
+    width, height = TIME_SERIES_SIZE
+    scale = box_width.inches * SLIDE_IMAGE_DPI / width
+    return figure_to_png(fig_time, width=width, height=height, scale=round(scale, 3))
+
+
+def save_presentation(prs: Presentation) -> str:
+    """
+    Save a presentation to a temporary .pptx file
+
+    Writing to disk keeps the finished deck out of the session's memory; the
+    caller streams the file into st.download_button and then deletes it.
+
+    Args:
+        prs: Presentation to save
+
+    Returns:
+        Path of the temporary .pptx file
+    """
+    with tempfile.NamedTemporaryFile(suffix='.pptx', delete=False) as tmp:
+        prs.save(tmp)
+    return tmp.name
 
 
 def create_single_channel_ppt(config: Dict, 
                               fig_time, 
                               country_chart_img: BytesIO,  
                               stats_text: str,
-                              slug_data: Dict) -> BytesIO:
+                              slug_data: Dict) -> str:
     """
     Generate PowerPoint presentation for single channel with space for images
     
     Args:
         config: Configuration dictionary with channel name, date range, etc.
+            ('compact_images' palette-compresses the embedded charts)
         fig_time: Time series chart figure
         country_chart_img: Country pie chart image (BytesIO)
         stats_text: Formatted stats text
         slug_data: Slug visualization data
     
     Returns:
-        BytesIO object containing PowerPoint file
+        Path of the saved .pptx file (see save_presentation)
     """
     # Create presentation
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
-    
-    # Common layout constants (grid)
-    LEFT_MARGIN   = Inches(0.5)
-    TOP_ROW_Y     = Inches(1.0)
-    ROW_GAP       = Inches(0.5)
-    BOX_WIDTH     = Inches(3.6)   
-    BOX_HEIGHT    = Inches(2.8)   
-    COL_GAP       = Inches(0.3)
-    
-    COL1_X        = LEFT_MARGIN
-    COL2_X        = COL1_X + BOX_WIDTH + COL_GAP
-    BOTTOM_ROW_Y  = TOP_ROW_Y + BOX_HEIGHT + ROW_GAP
-
-    # Right column placeholder for manual images 
-    RIGHT_PLACEHOLDER_WIDTH = Inches(1.6)
-    RIGHT_MARGIN            = Inches(0.3)
-    RIGHT_PLACEHOLDER_X     = prs.slide_width - RIGHT_PLACEHOLDER_WIDTH - RIGHT_MARGIN
+    prs = _new_presentation()
+    compact = config.get('compact_images', False)
 
     # Add blank slide
     blank_slide_layout = prs.slide_layouts[6]
@@ -73,40 +276,14 @@ def create_single_channel_ppt(config: Dict,
     title_para.font.name = 'Arial'
     
     # === Top Left - Time Series Chart (Plotly) ===
-    img_bytes = fig_time.to_image(format="png", width=800, height=600)
-    img_stream = BytesIO(img_bytes)
-    pic = slide.shapes.add_picture(
-        img_stream,
-        COL1_X, TOP_ROW_Y,
-        width=BOX_WIDTH,
-        height=BOX_HEIGHT
-    )
-    pic.line.color.rgb = RGBColor(200, 200, 200)  # Light gray border  
-    pic.line.width = Pt(1)
+    img_bytes = _time_series_png(fig_time, BOX_WIDTH)
+    _place_bordered_picture(slide, BytesIO(img_bytes), COL1_X, TOP_ROW_Y, BOX_WIDTH, BOX_HEIGHT, compact)
 
     # === Top Right - 3D Pie Chart (matplotlib BytesIO) ===
-    country_chart_img.seek(0)  
-    pic2 = slide.shapes.add_picture(
-        country_chart_img,
-        COL2_X, TOP_ROW_Y,
-        width=BOX_WIDTH,
-        height=BOX_HEIGHT
-    )
-    pic2.line.color.rgb = RGBColor(200, 200, 200)  
-    pic2.line.width = Pt(1)  
+    _place_bordered_picture(slide, country_chart_img, COL2_X, TOP_ROW_Y, BOX_WIDTH, BOX_HEIGHT, compact)
       
     # === Right Column - Placeholder text box for images ===
-    placeholder_box = slide.shapes.add_textbox(
-        RIGHT_PLACEHOLDER_X, TOP_ROW_Y,
-        RIGHT_PLACEHOLDER_WIDTH, Inches(6.0)
-    )
-    placeholder_frame = placeholder_box.text_frame
-    placeholder_frame.text = "[ Add images here ]"
-    placeholder_para = placeholder_frame.paragraphs[0]
-    placeholder_para.font.size = Pt(10)
-    placeholder_para.font.italic = True
-    placeholder_para.font.color.rgb = RGBColor(150, 150, 150)
-    placeholder_para.alignment = PP_ALIGN.CENTER
+    _add_image_placeholder(slide, RIGHT_PLACEHOLDER_X, TOP_ROW_Y, RIGHT_PLACEHOLDER_WIDTH, Inches(6.0))
     
     # === Bottom Left - Stats Text Box ===
     stats_box = slide.shapes.add_textbox(
@@ -114,66 +291,19 @@ def create_single_channel_ppt(config: Dict,
         BOX_WIDTH, BOX_HEIGHT
     )
     # Add border  
-    stats_box.line.color.rgb = RGBColor(200, 200, 200)  
+    stats_box.line.color.rgb = _BORDER_GRAY
     stats_box.line.width = Pt(1)  
     # Add subtle background - can remove if not required
     stats_box.fill.solid()  
-    stats_box.fill.fore_color.rgb = RGBColor(250, 250, 250)  # Very light gray
-
-    stats_frame = stats_box.text_frame
-    stats_frame.text = stats_text
-    stats_frame.word_wrap = True
-
-    for paragraph in stats_frame.paragraphs:
-        paragraph.font.size = Pt(10)
-        paragraph.font.name = 'Arial'
-        paragraph.font.bold = True
-        paragraph.space_after = Pt(6)
+    stats_box.fill.fore_color.rgb = _BG_GRAY
 
+    _set_stats_text(stats_box, stats_text)
     
     # === Bottom Right - Top Slug Display ===
-    if slug_data:  
-        slug_box = slide.shapes.add_textbox(
-            COL2_X, BOTTOM_ROW_Y,
-            BOX_WIDTH, BOX_HEIGHT
-        )  
-        # Add border  
-        slug_box.line.color.rgb = RGBColor(200, 200, 200)  
-        slug_box.line.width = Pt(1)  
-        # Add subtle background (optional)
-        slug_box.fill.solid()  
-        slug_box.fill.fore_color.rgb = RGBColor(250, 250, 250)
-        
-        slug_frame = slug_box.text_frame  
-        slug_frame.word_wrap = True  
-        slug_frame.vertical_anchor = 1  # Center vertically
-        
-        # Large percentage  
-        p_pct = slug_frame.paragraphs[0]  
-        p_pct.text = f"{slug_data['percentage']:.0f}%"  
-        p_pct.font.size = Pt(72)  
-        p_pct.font.bold = True  
-        p_pct.font.name = 'Arial'  
-        p_pct.font.color.rgb = RGBColor(217, 120, 71)  # Orange color  
-        p_pct.alignment = PP_ALIGN.CENTER  
-        p_pct.space_after = Pt(8)
-        
-        # Text: "of detections since [date] about [slug]"  
-        p_text = slug_frame.add_paragraph()  
-        earliest_date = slug_data.get('earliest_date', '2024')  
-        p_text.text = f"of detections since {earliest_date}\nabout {slug_data['clean_slug']}"  
-        p_text.font.size = Pt(13)  
-        p_text.font.name = 'Arial'  
-        p_text.font.bold = False  
-        p_text.font.color.rgb = RGBColor(100, 100, 100)  
-        p_text.alignment = PP_ALIGN.CENTER   
-
-    # Save to BytesIO
-    ppt_stream = BytesIO()
-    prs.save(ppt_stream)
-    ppt_stream.seek(0)
-    
-    return ppt_stream
+    if slug_data:
+        _add_slug_box(slide, COL2_X, BOTTOM_ROW_Y, BOX_WIDTH, BOX_HEIGHT, slug_data)
+
+    return save_presentation(prs)
 
 
 def create_multi_channel_ppt(config: Dict,
@@ -182,41 +312,28 @@ def create_multi_channel_ppt(config: Dict,
                              stats_text: str,
                              slug_data: Dict,
                              channel_charts: Dict[str, BytesIO],
-                             comprehensive_data=None) -> BytesIO:
+                             comprehensive_data=None,
+                             bottom_left_cols: Dict = None) -> str:
     """
     Generate PowerPoint presentation for multiple channels with space for images
     
     Args:
         config: Configuration dictionary
+            ('compact_images' palette-compresses the embedded charts)
         fig_time: Time series Plotly chart figure
         country_chart_img: Main country pie chart (BytesIO matplotlib image)
         stats_text: Formatted stats text
         slug_data: Slug visualization data
         channel_charts: Dictionary of channel-specific charts (BytesIO images)
+        comprehensive_data: Bottom left DataFrame for the channel airtime chart
+        bottom_left_cols: Column lookup from prepare_bottom_left_data
     
     Returns:
-        BytesIO object containing PowerPoint file
+        Path of the saved .pptx file (see save_presentation)
     """
     # Create presentation
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
-
-    # Shared layout constants (reuse same grid as single-channel)
-    LEFT_MARGIN   = Inches(0.5)
-    TOP_ROW_Y     = Inches(1.0)
-    ROW_GAP       = Inches(0.5)
-    BOX_WIDTH     = Inches(3.6)
-    BOX_HEIGHT    = Inches(2.8)
-    COL_GAP       = Inches(0.3)
-
-    COL1_X        = LEFT_MARGIN
-    COL2_X        = COL1_X + BOX_WIDTH + COL_GAP
-    BOTTOM_ROW_Y  = TOP_ROW_Y + BOX_HEIGHT + ROW_GAP
-
-    RIGHT_PLACEHOLDER_WIDTH = Inches(1.6)
-    RIGHT_MARGIN            = Inches(0.3)
-    RIGHT_PLACEHOLDER_X     = prs.slide_width - RIGHT_PLACEHOLDER_WIDTH - RIGHT_MARGIN
+    prs = _new_presentation()
+    compact = config.get('compact_images', False)
     
     # === SLIDE 1: Main Overview ===
     blank_slide_layout = prs.slide_layouts[6]
@@ -233,8 +350,8 @@ def create_multi_channel_ppt(config: Dict,
     title_para.font.name = 'Arial'
     
     # Top Left - Time Series (Plotly)
-    img_bytes = fig_time.to_image(format="png", width=800, height=600)
-    img_stream = BytesIO(img_bytes)
+    img_bytes = _time_series_png(fig_time, BOX_WIDTH)
+    img_stream = _picture_stream(BytesIO(img_bytes), compact)
     slide1.shapes.add_picture(
         img_stream,
         COL1_X, TOP_ROW_Y,
@@ -242,125 +359,36 @@ def create_multi_channel_ppt(config: Dict,
         height=BOX_HEIGHT
     )
     
-    # Top Right - Channel Airtime Distribution (for multi-channel)  
-    if comprehensive_data is not None:  
+    # Top Right - Channel Airtime Distribution (for multi-channel),
+    # falling back to the country chart when it is missing or fails
+    top_right_img = country_chart_img
+    if comprehensive_data is not None and not comprehensive_data.empty:  
         try:  
-            # Generate channel airtime chart  
-            channel_airtime_img = generate_channel_airtime_pie(  
-                comprehensive_data,  
-                title="Time on air by channel",  
-                subtitle="Material under 30 days"  
+            airtime_png = generate_channel_airtime_pie(
+                comprehensive_data,
+                title="Time on air by channel",
+                subtitle="Material under 30 days",
+                cols=bottom_left_cols
             )
-            
-            # Check if chart was generated successfully  
-            if channel_airtime_img.getbuffer().nbytes > 0:  
-                channel_airtime_img.seek(0)  
-                pic2 = slide1.shapes.add_picture(  
-                    channel_airtime_img,  
-                    COL2_X, TOP_ROW_Y,  
-                    width=BOX_WIDTH,  
-                    height=BOX_HEIGHT  
-                )  
-                pic2.line.color.rgb = RGBColor(200, 200, 200)  
-                pic2.line.width = Pt(1)  
-            else:  
-                # Fallback to country chart  
-                country_chart_img.seek(0)  
-                pic2 = slide1.shapes.add_picture(  
-                    country_chart_img,  
-                    COL2_X, TOP_ROW_Y,  
-                    width=BOX_WIDTH,  
-                    height=BOX_HEIGHT  
-                )  
-                pic2.line.color.rgb = RGBColor(200, 200, 200)  
-                pic2.line.width = Pt(1)  
-        except Exception as e:  
-            # If any error, fallback to country chart  
-            country_chart_img.seek(0)  
-            pic2 = slide1.shapes.add_picture(  
-                country_chart_img,  
-                COL2_X, TOP_ROW_Y,  
-                width=BOX_WIDTH,  
-                height=BOX_HEIGHT  
-            )  
-            pic2.line.color.rgb = RGBColor(200, 200, 200)  
-            pic2.line.width = Pt(1)  
-    else:  
-        # No comprehensive data provided - use country chart  
-        country_chart_img.seek(0)  
-        pic2 = slide1.shapes.add_picture(  
-            country_chart_img,  
-            COL2_X, TOP_ROW_Y,  
-            width=BOX_WIDTH,  
-            height=BOX_HEIGHT  
-        )  
-        pic2.line.color.rgb = RGBColor(200, 200, 200)  
-        pic2.line.width = Pt(1)
+            if airtime_png:
+                top_right_img = BytesIO(airtime_png)
+        except Exception:  
+            pass
+    _place_bordered_picture(slide1, top_right_img, COL2_X, TOP_ROW_Y, BOX_WIDTH, BOX_HEIGHT, compact)
     
     # Placeholder for images on the right   
-    placeholder_box = slide1.shapes.add_textbox(  
-        RIGHT_PLACEHOLDER_X, TOP_ROW_Y,  
-        RIGHT_PLACEHOLDER_WIDTH, Inches(6.0)  
-    )  
-    placeholder_frame = placeholder_box.text_frame  
-    placeholder_frame.text = "[ Add images here ]"  
-    placeholder_para = placeholder_frame.paragraphs[0]  
-    placeholder_para.font.size = Pt(10)  
-    placeholder_para.font.italic = True  
-    placeholder_para.font.color.rgb = RGBColor(150, 150, 150)  
-    placeholder_para.alignment = PP_ALIGN.CENTER  
+    _add_image_placeholder(slide1, RIGHT_PLACEHOLDER_X, TOP_ROW_Y, RIGHT_PLACEHOLDER_WIDTH, Inches(6.0))
     
     # Bottom Left - Stats
     stats_box = slide1.shapes.add_textbox(
         COL1_X, BOTTOM_ROW_Y,
         BOX_WIDTH, BOX_HEIGHT
     )
-    stats_frame = stats_box.text_frame
-    stats_frame.text = stats_text
-    stats_frame.word_wrap = True
-    
-    for paragraph in stats_frame.paragraphs:
-        paragraph.font.size = Pt(10)
-        paragraph.font.name = 'Arial'
-        paragraph.font.bold = True
-        paragraph.space_after = Pt(6)
+    _set_stats_text(stats_box, stats_text)
     
     # Bottom Right - Top Slug
-    if slug_data:  
-        slug_box = slide1.shapes.add_textbox(
-            COL2_X, BOTTOM_ROW_Y,
-            BOX_WIDTH, BOX_HEIGHT
-        )  
-        # Add border  
-        slug_box.line.color.rgb = RGBColor(200, 200, 200)  
-        slug_box.line.width = Pt(1)  
-        # Optional: add subtle background  
-        slug_box.fill.solid()  
-        slug_box.fill.fore_color.rgb = RGBColor(250, 250, 250)
-        
-        slug_frame = slug_box.text_frame  
-        slug_frame.word_wrap = True  
-        slug_frame.vertical_anchor = 1  # Center vertically
-        
-        # Large percentage in ORANGE  
-        p_pct = slug_frame.paragraphs[0]  
-        p_pct.text = f"{slug_data['percentage']:.0f}%"  
-        p_pct.font.size = Pt(72)  
-        p_pct.font.bold = True  
-        p_pct.font.name = 'Arial'  
-        p_pct.font.color.rgb = RGBColor(217, 120, 71)  # Orange color  
-        p_pct.alignment = PP_ALIGN.CENTER  
-        p_pct.space_after = Pt(8)
-        
-        # Text: "of detections since [date] about [slug]"  
-        p_text = slug_frame.add_paragraph()  
-        earliest_date = slug_data.get('earliest_date', '2024')  
-        p_text.text = f"of detections since {earliest_date}\nabout {slug_data['clean_slug']}"  
-        p_text.font.size = Pt(13)  
-        p_text.font.name = 'Arial'  
-        p_text.font.bold = False  
-        p_text.font.color.rgb = RGBColor(100, 100, 100)  
-        p_text.alignment = PP_ALIGN.CENTER   
+    if slug_data:
+        _add_slug_box(slide1, COL2_X, BOTTOM_ROW_Y, BOX_WIDTH, BOX_HEIGHT, slug_data)
 
     # === SLIDE 2: Channel Breakdown ===
     if channel_charts:
@@ -391,25 +419,10 @@ def create_multi_channel_ppt(config: Dict,
             y_pos = start_y + (row * (row_height + row_spacing))
             
             # Add matplotlib image from BytesIO
-            img_buffer.seek(0)
-            slide2.shapes.add_picture(img_buffer, Inches(x_pos), Inches(y_pos), width=Inches(col_width))
+            img_stream = _picture_stream(img_buffer, compact)
+            slide2.shapes.add_picture(img_stream, Inches(x_pos), Inches(y_pos), width=Inches(col_width))
         
         # Placeholder on slide 2 as well
-        placeholder_box2 = slide2.shapes.add_textbox(
-            RIGHT_PLACEHOLDER_X, TOP_ROW_Y,
-            RIGHT_PLACEHOLDER_WIDTH, Inches(6.0)
-        )
-        placeholder_frame2 = placeholder_box2.text_frame
-        placeholder_frame2.text = "[ Add images here ]"
-        placeholder_para2 = placeholder_frame2.paragraphs[0]
-        placeholder_para2.font.size = Pt(10)
-        placeholder_para2.font.italic = True
-        placeholder_para2.font.color.rgb = RGBColor(150, 150, 150)
-        placeholder_para2.alignment = PP_ALIGN.CENTER
-    
-    # Save to BytesIO
-    ppt_stream = BytesIO()
-    prs.save(ppt_stream)
-    ppt_stream.seek(0)
+        _add_image_placeholder(slide2, RIGHT_PLACEHOLDER_X, TOP_ROW_Y, RIGHT_PLACEHOLDER_WIDTH, Inches(6.0))
     
-    return ppt_stream
\ No newline at end of file
+    return save_presentation(prs)
\ No newline at end of file